@@ -49,9 +49,10 @@ def main() -> None:
 
 
 def _create_aws_client(profile_name: str | None) -> "ECSClient":
+    # Task history lists and describes tasks concurrently, so leave pool room and retry throttled calls
     config = Config(
-        max_pool_connections=5,
-        retries={"max_attempts": 2, "mode": "adaptive"},
+        max_pool_connections=10,
+        retries={"max_attempts": 5, "mode": "adaptive"},
     )
 
     session = boto3.Session(profile_name=profile_name) if profile_name else boto3
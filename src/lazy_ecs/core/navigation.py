@@ -1,11 +1,16 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING, Any
+
 import questionary
 from prompt_toolkit.key_binding import KeyBindings
 from prompt_toolkit.key_binding.key_processor import KeyPressEvent
 from prompt_toolkit.keys import Keys
 from rich.console import Console
 
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
 PAGINATION_THRESHOLD = 30
 
 
@@ -59,7 +64,7 @@ def add_navigation_choices(choices: list[dict[str, str]], back_text: str) -> lis
     ]
 
 
-def add_navigation_choices_with_shortcuts(choices: list[dict[str, str]], back_text: str | None) -> list:
+def add_navigation_choices_with_shortcuts(choices: Sequence[Mapping[str, Any]], back_text: str | None) -> list:
     nav_choices = []
 
     for choice in choices:
@@ -73,7 +78,7 @@ def add_navigation_choices_with_shortcuts(choices: list[dict[str, str]], back_te
     return nav_choices
 
 
-def select_with_navigation(prompt: str, choices: list[dict[str, str]], back_text: str | None) -> str | None:
+def select_with_navigation(prompt: str, choices: Sequence[Mapping[str, Any]], back_text: str | None) -> str | None:
     nav_choices = add_navigation_choices_with_shortcuts(choices, back_text)
     question = questionary.select(prompt, choices=nav_choices, style=get_questionary_style(), use_shortcuts=True)
 
@@ -107,7 +112,7 @@ def select_with_navigation(prompt: str, choices: list[dict[str, str]], back_text
 
 def select_with_pagination(
     prompt: str,
-    choices: list[dict[str, str]],
+    choices: Sequence[Mapping[str, Any]],
     back_text: str | None,
     page_size: int = 25,
 ) -> str | None:
@@ -161,7 +166,7 @@ def select_with_pagination(
 
 def select_with_auto_pagination(
     prompt: str,
-    choices: list[dict[str, str]],
+    choices: Sequence[Mapping[str, Any]],
     back_text: str | None,
     threshold: int = PAGINATION_THRESHOLD,
 ) -> str | None:
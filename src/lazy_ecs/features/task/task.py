@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, Any, Literal, TypedDict
 
 from botocore.exceptions import BotoCoreError, ClientError
@@ -14,7 +16,10 @@ from ...core.utils import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from mypy_boto3_ecs.client import ECSClient
+    from mypy_boto3_ecs.paginator import ListTasksPaginator
     from mypy_boto3_ecs.type_defs import TaskDefinitionTypeDef, TaskTypeDef
 
 # Exit code mapping: exit_code -> (brief_reason, emoji, description)
@@ -25,8 +30,25 @@ EXIT_CODE_INFO: dict[int, tuple[str, str, str]] = {
     1: ("app error", "❌", "application error (exit code 1)"),
 }
 
+STOP_CODE_BRIEF_REASONS: dict[str, str] = {
+    "TaskFailedToStart": "failed to start",
+    "ServiceSchedulerInitiated": "scheduler stopped",
+    "SpotInterruption": "spot interrupted",
+    "UserInitiated": "user stopped",
+}
+
 DEFAULT_STOPPED_TASK_HISTORY_LIMIT = 50
 
+# ListTasks returns at most 100 ARNs per page
+LIST_TASKS_MAX_PAGE_SIZE = 100
+
+# DescribeTasks accepts at most 100 ARNs per call; keep workers under the client's connection pool
+DESCRIBE_TASKS_BATCH_SIZE = 100
+MAX_DESCRIBE_TASKS_WORKERS = 4
+
+# Stopped tasks never change, so history refreshes only need to describe new or running ones
+STOPPED_TASK_CACHE_SIZE = 500
+
 
 class _PaginateKwargs(TypedDict, total=False):
     cluster: str
@@ -37,6 +59,9 @@ class _PaginateKwargs(TypedDict, total=False):
 class TaskService:
     def __init__(self, ecs_client: ECSClient) -> None:
         self.ecs_client = ecs_client
+        self._task_definition_cache: dict[str, TaskDefinitionTypeDef] = {}
+        self._list_tasks_paginator: ListTasksPaginator | None = None
+        self._stopped_task_cache: OrderedDict[str, TaskTypeDef] = OrderedDict()
 
     def get_tasks(self, cluster_name: str, service_name: str) -> list[str]:
         return paginate_aws_list(
@@ -63,11 +88,7 @@ class TaskService:
         if not task_arns:
             return []
 
-        all_tasks = [
-            task
-            for batch in batch_items(task_arns, 100)
-            for task in self.ecs_client.describe_tasks(cluster=cluster_name, tasks=batch).get("tasks", [])
-        ]
+        all_tasks = self._describe_tasks(cluster_name, task_arns)
 
         return [_create_task_info(task, desired_task_def_arn) for task in all_tasks]
 
@@ -96,14 +117,76 @@ class TaskService:
             return None
 
         task = tasks[0]
-        task_def_arn = task["taskDefinitionArn"]
-        task_def_response = self.ecs_client.describe_task_definition(taskDefinition=task_def_arn)
-        task_definition = task_def_response.get("taskDefinition")
+        task_definition = self._get_task_definition_cached(task["taskDefinitionArn"])
         if not task_definition:
             return None
 
         return task, task_definition
 
+    def _get_task_definition_cached(self, task_def_arn: str) -> TaskDefinitionTypeDef | None:
+        # Revision ARNs are immutable, so a fetched definition never goes stale
+        if task_def_arn in self._task_definition_cache:
+            return self._task_definition_cache[task_def_arn]
+
+        task_definition = self.ecs_client.describe_task_definition(taskDefinition=task_def_arn).get("taskDefinition")
+        if task_definition:
+            self._task_definition_cache[task_def_arn] = task_definition
+        return task_definition
+
+    def _describe_tasks(self, cluster_name: str, task_arns: list[str]) -> list[TaskTypeDef]:
+        def describe_batch(batch: list[str]) -> list[TaskTypeDef]:
+            return self.ecs_client.describe_tasks(cluster=cluster_name, tasks=batch).get("tasks", [])
+
+        batches = list(batch_items(task_arns, DESCRIBE_TASKS_BATCH_SIZE))
+        if not batches:
+            return []
+        if len(batches) == 1:
+            return describe_batch(batches[0])
+
+        with ThreadPoolExecutor(max_workers=min(len(batches), MAX_DESCRIBE_TASKS_WORKERS)) as executor:
+            return [task for tasks in executor.map(describe_batch, batches) for task in tasks]
+
+    def _describe_tasks_with_stopped_cache(self, cluster_name: str, task_arns: list[str]) -> list[TaskTypeDef]:
+        uncached_arns = [task_arn for task_arn in task_arns if task_arn not in self._stopped_task_cache]
+        fetched = {}
+        if uncached_arns:
+            fetched = {task["taskArn"]: task for task in self._describe_tasks(cluster_name, uncached_arns)}
+
+        for task_arn, task in fetched.items():
+            if task.get("lastStatus") == "STOPPED":
+                self._stopped_task_cache[task_arn] = task
+                if len(self._stopped_task_cache) > STOPPED_TASK_CACHE_SIZE:
+                    self._stopped_task_cache.popitem(last=False)
+
+        tasks = []
+        for task_arn in task_arns:
+            if task_arn in fetched:
+                tasks.append(fetched[task_arn])
+            elif task_arn in self._stopped_task_cache:
+                self._stopped_task_cache.move_to_end(task_arn)
+                tasks.append(self._stopped_task_cache[task_arn])
+        return tasks
+
+    def _get_list_tasks_paginator(self) -> ListTasksPaginator:
+        if self._list_tasks_paginator is None:
+            self._list_tasks_paginator = self.ecs_client.get_paginator("list_tasks")
+        return self._list_tasks_paginator
+
+    def _list_history_task_arns(
+        self,
+        cluster_name: str,
+        service_name: str | None,
+        stopped_limit: int | None,
+    ) -> tuple[list[str], list[str]]:
+        if stopped_limit == 0:
+            return self._list_tasks_by_status(cluster_name, service_name, "RUNNING"), []
+        # Create the shared paginator up front so the two listing threads do not race to build it
+        self._get_list_tasks_paginator()
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            running = executor.submit(self._list_tasks_by_status, cluster_name, service_name, "RUNNING")
+            stopped = executor.submit(self._list_tasks_by_status, cluster_name, service_name, "STOPPED", stopped_limit)
+            return running.result(), stopped.result()
+
     def _list_tasks_by_status(
         self,
         cluster_name: str,
@@ -111,7 +194,10 @@ class TaskService:
         desired_status: Literal["PENDING", "RUNNING", "STOPPED"],
         max_items: int | None = None,
     ) -> list[str]:
-        paginator = self.ecs_client.get_paginator("list_tasks")
+        if max_items == 0:
+            return []
+
+        paginator = self._get_list_tasks_paginator()
 
         paginate_kwargs: _PaginateKwargs = {
             "cluster": cluster_name,
@@ -123,7 +209,7 @@ class TaskService:
         if max_items is not None:
             page_iterator = paginator.paginate(
                 **paginate_kwargs,
-                PaginationConfig={"MaxItems": max_items},
+                PaginationConfig={"MaxItems": max_items, "PageSize": min(max_items, LIST_TASKS_MAX_PAGE_SIZE)},
             )
         else:
             page_iterator = paginator.paginate(**paginate_kwargs)
@@ -143,28 +229,28 @@ class TaskService:
         service_name: str | None = None,
         stopped_limit: int | None = DEFAULT_STOPPED_TASK_HISTORY_LIMIT,
     ) -> list[TaskHistoryDetails]:
+        return list(self.iter_task_history(cluster_name, service_name, stopped_limit=stopped_limit))
+
+    def iter_task_history(
+        self,
+        cluster_name: str,
+        service_name: str | None = None,
+        stopped_limit: int | None = DEFAULT_STOPPED_TASK_HISTORY_LIMIT,
+    ) -> Iterator[TaskHistoryDetails]:
+        """Lists and describes tasks eagerly; entries are parsed as they are consumed."""
         if stopped_limit is not None and stopped_limit < 0:
             error_message = "stopped_limit must be >= 0 or None"
             raise ValueError(error_message)
 
-        task_arns = []
-
-        running_arns = self._list_tasks_by_status(cluster_name, service_name, "RUNNING")
-        task_arns.extend(running_arns)
-
-        stopped_arns = self._list_tasks_by_status(cluster_name, service_name, "STOPPED", max_items=stopped_limit)
-        task_arns.extend(stopped_arns)
+        running_arns, stopped_arns = self._list_history_task_arns(cluster_name, service_name, stopped_limit)
+        task_arns = [*running_arns, *stopped_arns]
 
         if not task_arns:
-            return []
+            return iter(())
 
-        all_tasks = [
-            task
-            for batch in batch_items(task_arns, 100)
-            for task in self.ecs_client.describe_tasks(cluster=cluster_name, tasks=batch).get("tasks", [])
-        ]
+        all_tasks = self._describe_tasks_with_stopped_cache(cluster_name, task_arns)
 
-        return [self._parse_task_history(task) for task in all_tasks]
+        return (self._parse_task_history(task) for task in all_tasks)
 
     def get_task_failure_analysis(self, task_history: TaskHistoryDetails) -> str:
         if task_history["last_status"] == "RUNNING":
@@ -265,22 +351,14 @@ class TaskService:
 
 
 def _get_brief_exit_reason(exit_code: int) -> str:
-    if exit_code in EXIT_CODE_INFO:
-        brief_reason, _, _ = EXIT_CODE_INFO[exit_code]
-        return brief_reason
-    return f"exit {exit_code}"
+    exit_info = EXIT_CODE_INFO.get(exit_code)
+    return exit_info[0] if exit_info else f"exit {exit_code}"
 
 
 def _get_brief_stop_reason(stop_code: str | None) -> str | None:
     if not stop_code:
         return None
-    reasons = {
-        "TaskFailedToStart": "failed to start",
-        "ServiceSchedulerInitiated": "scheduler stopped",
-        "SpotInterruption": "spot interrupted",
-        "UserInitiated": "user stopped",
-    }
-    return reasons.get(stop_code, stop_code.lower())
+    return STOP_CODE_BRIEF_REASONS.get(stop_code, stop_code.lower())
 
 
 def _get_brief_failure_reason(task: TaskTypeDef | dict[str, Any]) -> str | None:
@@ -288,13 +366,14 @@ def _get_brief_failure_reason(task: TaskTypeDef | dict[str, Any]) -> str | None:
     if last_status == "RUNNING":
         return None
 
-    for container in task.get("containers", []):
-        exit_code = container.get("exitCode")
-        if exit_code is not None and exit_code != 0:
-            return _get_brief_exit_reason(exit_code)
+    failed_exit_code = next(
+        (exit_code for container in task.get("containers", []) if (exit_code := container.get("exitCode"))),
+        None,
+    )
+    if failed_exit_code is not None:
+        return _get_brief_exit_reason(failed_exit_code)
 
-    stop_code = task.get("stopCode")
-    return _get_brief_stop_reason(stop_code)
+    return _get_brief_stop_reason(task.get("stopCode"))
 
 
 def _create_task_info(task: TaskTypeDef | dict[str, Any], desired_task_def_arn: str | None) -> TaskInfo:
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import heapq
+from collections.abc import Iterable, Iterator
 from datetime import datetime
 from typing import Any
 
@@ -19,6 +21,22 @@ console = Console()
 MAX_RECENT_TASKS = 10
 SEPARATOR_WIDTH = 80
 
+_TASK_ACTION_CHOICES: tuple[dict[str, str], ...] = (
+    {"name": "Show task details", "value": "task_action:show_details"},
+    {"name": "Show task history and failures", "value": "task_action:show_history"},
+    {"name": "Compare task definitions", "value": "task_action:compare_definitions"},
+    {"name": "Open in AWS console", "value": "task_action:open_console"},
+    {"name": "Stop task", "value": "task_action:stop_task"},
+)
+
+_CONTAINER_ACTION_TEMPLATES: tuple[tuple[str, str], ...] = (
+    ("tail_logs", "Show logs (tail) for container '{container}'"),
+    ("show_env", "Show environment variables for '{container}'"),
+    ("show_secrets", "Show secrets for '{container}'"),
+    ("show_ports", "Show port mappings for '{container}'"),
+    ("show_volumes", "Show volume mounts for '{container}'"),
+)
+
 _CHANGE_TYPE_DISPLAY = {
     "image_changed": ("🐳", "Image changed for '{container}'"),
     "env_added": ("+", "Environment variable added ({container})"),
@@ -52,9 +70,7 @@ class TaskUI:
             console.print(f"Auto-selected single task: {available_tasks[0]['name']}", style="cyan")
             return available_tasks[0]["value"]
 
-        choices = [{"name": task["name"], "value": task["value"]} for task in available_tasks]
-
-        selected = select_with_auto_pagination("Select a task:", choices, "Back to service selection")
+        selected = select_with_auto_pagination("Select a task:", available_tasks, "Back to service selection")
 
         if selected:
             console.print("Task selected successfully!", style="blue")
@@ -140,44 +156,17 @@ class TaskUI:
         if not containers:
             return None
 
-        choices = []
-
-        choices.extend(
-            [
-                {"name": "Show task details", "value": "task_action:show_details"},
-                {"name": "Show task history and failures", "value": "task_action:show_history"},
-                {"name": "Compare task definitions", "value": "task_action:compare_definitions"},
-                {"name": "Open in AWS console", "value": "task_action:open_console"},
-                {"name": "Stop task", "value": "task_action:stop_task"},
-            ],
-        )
-
-        for container in containers:
-            container_name = container["name"]
-            choices.extend(
-                [
-                    {
-                        "name": f"Show logs (tail) for container '{container_name}'",
-                        "value": f"container_action:tail_logs:{container_name}",
-                    },
-                    {
-                        "name": f"Show environment variables for '{container_name}'",
-                        "value": f"container_action:show_env:{container_name}",
-                    },
-                    {
-                        "name": f"Show secrets for '{container_name}'",
-                        "value": f"container_action:show_secrets:{container_name}",
-                    },
-                    {
-                        "name": f"Show port mappings for '{container_name}'",
-                        "value": f"container_action:show_ports:{container_name}",
-                    },
-                    {
-                        "name": f"Show volume mounts for '{container_name}'",
-                        "value": f"container_action:show_volumes:{container_name}",
-                    },
-                ],
-            )
+        choices = [
+            *_TASK_ACTION_CHOICES,
+            *(
+                {
+                    "name": name_template.format(container=container["name"]),
+                    "value": f"container_action:{action}:{container['name']}",
+                }
+                for container in containers
+                for action, name_template in _CONTAINER_ACTION_TEMPLATES
+            ),
+        ]
 
         return select_with_auto_pagination("Select a feature for this task:", choices, "Back to service selection")
 
@@ -191,25 +180,19 @@ class TaskUI:
         console.print("=" * SEPARATOR_WIDTH, style="dim")
 
         with show_spinner():
-            task_history = self.task_service.get_task_history(cluster_name, service_name, stopped_limit=stopped_limit)
+            task_history = self.task_service.iter_task_history(cluster_name, service_name, stopped_limit=stopped_limit)
+            recent_tasks, fetched_count = _select_recent_tasks(task_history, MAX_RECENT_TASKS)
 
-        if not task_history:
+        if not fetched_count:
             print_warning("No task history found for this service")
             return
 
-        sorted_history = sorted(
-            task_history,
-            key=lambda t: t["created_at"] or datetime.min,
-            reverse=True,
-        )
-        recent_tasks = sorted_history[:MAX_RECENT_TASKS]
-
         table = self._create_history_table()
         for task in recent_tasks:
             table.add_row(*self._format_task_row(task))
 
         console.print(table)
-        console.print(f"Showing {len(recent_tasks)} of {len(sorted_history)} fetched tasks.", style="dim")
+        console.print(f"Showing {len(recent_tasks)} of {fetched_count} fetched tasks.", style="dim")
         if stopped_limit is not None:
             console.print(f"⚠️ Stopped task history fetch is capped at {stopped_limit} tasks.", style="dim")
         self._display_history_summary(recent_tasks)
@@ -393,6 +376,22 @@ class TaskUI:
             console.print(f"   + {change.get('new')}", style="green")
 
 
+def _select_recent_tasks(
+    task_history: Iterable[TaskHistoryDetails], limit: int
+) -> tuple[list[TaskHistoryDetails], int]:
+    """Returns the newest tasks and how many were fetched, in a single pass."""
+    fetched_count = 0
+
+    def counted() -> Iterator[TaskHistoryDetails]:
+        nonlocal fetched_count
+        for task in task_history:
+            fetched_count += 1
+            yield task
+
+    recent_tasks = heapq.nlargest(limit, counted(), key=lambda t: t["created_at"] or datetime.min)
+    return recent_tasks, fetched_count
+
+
 def _format_ports(ports: list[dict[str, Any]]) -> str:
     if not ports:
         return "none"
@@ -1,8 +1,31 @@
 """Shared pytest fixtures for tests."""
 
-from unittest.mock import Mock
+from __future__ import annotations
 
+from collections.abc import Callable, Iterator
+from itertools import count
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any
+from unittest.mock import Mock, create_autospec
+
+import boto3
 import pytest
+from moto import mock_aws
+
+from lazy_ecs.aws_service import ECSService
+from lazy_ecs.features.container.container import ContainerService
+from lazy_ecs.features.service.actions import ServiceActions
+from lazy_ecs.features.service.service import ServiceService
+from lazy_ecs.features.task.task import TaskService
+
+if TYPE_CHECKING:
+    from mypy_boto3_ecs.client import ECSClient
+
+    from lazy_ecs.core.types import TaskDetails
+
+MOTO_TASK_DEFINITION = "web-task"
+
+_moto_cluster_ids = count()
 
 
 @pytest.fixture
@@ -17,6 +40,132 @@ def mock_paginated_client():
     return _create_client
 
 
+@pytest.fixture
+def mock_history_client():
+    def _create_client(
+        running_pages: list[dict],
+        stopped_pages: list[dict],
+        tasks: list[dict] | None = None,
+    ) -> Mock:
+        pages_by_status = {"RUNNING": running_pages, "STOPPED": stopped_pages}
+        client = Mock()
+        paginator = Mock()
+        paginator.paginate.side_effect = lambda **kwargs: iter(pages_by_status[kwargs["desiredStatus"]])
+        client.get_paginator.return_value = paginator
+        client.describe_tasks.return_value = {"tasks": tasks or []}
+        return client
+
+    return _create_client
+
+
 @pytest.fixture
 def mock_ecs_client():
     return Mock()
+
+
+@pytest.fixture
+def mock_ecs_service() -> Mock:
+    # Autospec only covers class attributes, so the instance attributes ECSNavigator reads are set explicitly
+    service = create_autospec(ECSService, instance=True)
+    service.configure_mock(
+        ecs_client=Mock(),
+        _service=Mock(spec=ServiceService),
+        _service_actions=Mock(spec=ServiceActions),
+        _task=Mock(spec=TaskService),
+        _container=Mock(spec=ContainerService),
+    )
+    return service
+
+
+@pytest.fixture(scope="session")
+def sample_task_details() -> TaskDetails:
+    return {
+        "task_arn": "arn:aws:ecs:us-east-1:123456789012:task/test-cluster/abc123",
+        "task_definition_name": "web-api",
+        "task_definition_revision": "5",
+        "is_desired_version": True,
+        "task_status": "RUNNING",
+        "containers": [
+            {"name": "web-api", "image": "nginx:latest", "cpu": 256, "memory": 512, "memoryReservation": None},
+        ],
+        "created_at": None,
+        "started_at": None,
+    }
+
+
+@pytest.fixture
+def captured_console(monkeypatch) -> list[tuple[Any, ...]]:
+    printed: list[tuple[Any, ...]] = []
+    monkeypatch.setattr(
+        "lazy_ecs.features.task.ui.console",
+        SimpleNamespace(print=lambda *args, **_kwargs: printed.append(args)),
+    )
+    return printed
+
+
+# One session for the whole run: mock_aws resets boto3's default session on every start, so
+# clients built from a shared session keep botocore's parsed service models cached.
+@pytest.fixture(scope="session")
+def boto_session() -> boto3.Session:
+    return boto3.Session(region_name="us-east-1")
+
+
+@pytest.fixture
+def ecs_client(boto_session) -> Iterator[ECSClient]:
+    with mock_aws():
+        yield boto_session.client("ecs")
+
+
+# Module scope keeps moto's backend isolated per test module: a session-wide mock_aws would
+# swallow the nested mocks in other modules and leak their clusters into each other.
+@pytest.fixture(scope="module")
+def moto_ecs_client(boto_session) -> Iterator[ECSClient]:
+    with mock_aws():
+        ecs_client = boto_session.client("ecs")
+        ecs_client.register_task_definition(
+            family=MOTO_TASK_DEFINITION,
+            containerDefinitions=[{"name": "web", "image": "nginx", "memory": 256}],
+        )
+        yield ecs_client
+
+
+@pytest.fixture
+def moto_cluster(moto_ecs_client) -> str:
+    cluster_name = f"production-{next(_moto_cluster_ids)}"
+    moto_ecs_client.create_cluster(clusterName=cluster_name)
+    return cluster_name
+
+
+@pytest.fixture
+def moto_service(moto_ecs_client, moto_cluster) -> str:
+    service_name = "web"
+    moto_ecs_client.create_service(
+        cluster=moto_cluster,
+        serviceName=service_name,
+        taskDefinition=MOTO_TASK_DEFINITION,
+        desiredCount=0,
+    )
+    return service_name
+
+
+@pytest.fixture
+def run_moto_task(moto_ecs_client, moto_cluster) -> Callable[..., str]:
+    def _run_task(*, stopped: bool = False) -> str:
+        response = moto_ecs_client.run_task(
+            cluster=moto_cluster,
+            taskDefinition=MOTO_TASK_DEFINITION,
+            count=1,
+            launchType="FARGATE",
+            networkConfiguration={
+                "awsvpcConfiguration": {
+                    "subnets": ["subnet-12345"],
+                    "assignPublicIp": "ENABLED",
+                },
+            },
+        )
+        task_arn = response["tasks"][0]["taskArn"]
+        if stopped:
+            moto_ecs_client.stop_task(cluster=moto_cluster, task=task_arn, reason="history fixture")
+        return task_arn
+
+    return _run_task
@@ -2,197 +2,180 @@
 
 from unittest.mock import Mock
 
-import boto3
 import pytest
-from moto import mock_aws
 
 from lazy_ecs.aws_service import ECSService
 
 
 @pytest.fixture
-def ecs_client_with_clusters():
+def ecs_client_with_clusters(ecs_client):
     """Create a mocked ECS client with test clusters."""
-    with mock_aws():
-        client = boto3.client("ecs", region_name="us-east-1")
+    ecs_client.create_cluster(clusterName="production")
+    ecs_client.create_cluster(clusterName="staging")
+    ecs_client.create_cluster(clusterName="dev")
 
-        client.create_cluster(clusterName="production")
-        client.create_cluster(clusterName="staging")
-        client.create_cluster(clusterName="dev")
-
-        yield client
+    return ecs_client
 
 
 @pytest.fixture
-def ecs_client_with_services():
-    with mock_aws():
-        client = boto3.client("ecs", region_name="us-east-1")
-
-        client.create_cluster(clusterName="production")
+def ecs_client_with_services(ecs_client):
+    ecs_client.create_cluster(clusterName="production")
 
-        client.register_task_definition(
-            family="web-api-task",
-            containerDefinitions=[{"name": "web", "image": "nginx", "memory": 256}],
-        )
-        client.register_task_definition(
-            family="worker-task",
-            containerDefinitions=[{"name": "worker", "image": "worker", "memory": 256}],
-        )
+    ecs_client.register_task_definition(
+        family="web-api-task",
+        containerDefinitions=[{"name": "web", "image": "nginx", "memory": 256}],
+    )
+    ecs_client.register_task_definition(
+        family="worker-task",
+        containerDefinitions=[{"name": "worker", "image": "worker", "memory": 256}],
+    )
 
-        client.create_service(cluster="production", serviceName="web-api", taskDefinition="web-api-task")
-        client.create_service(cluster="production", serviceName="worker-service", taskDefinition="worker-task")
+    ecs_client.create_service(cluster="production", serviceName="web-api", taskDefinition="web-api-task")
+    ecs_client.create_service(cluster="production", serviceName="worker-service", taskDefinition="worker-task")
 
-        yield client
+    return ecs_client
 
 
 @pytest.fixture
-def ecs_client_with_tasks():
-    with mock_aws():
-        client = boto3.client("ecs", region_name="us-east-1")
-
-        client.create_cluster(clusterName="production")
-
-        client.register_task_definition(
-            family="web-api-task",
-            containerDefinitions=[
-                {
-                    "name": "web",
-                    "image": "nginx",
-                    "memory": 256,
-                    "logConfiguration": {
-                        "logDriver": "awslogs",
-                        "options": {"awslogs-group": "/ecs/production/web", "awslogs-stream-prefix": "ecs"},
-                    },
+def ecs_client_with_tasks(ecs_client):
+    ecs_client.create_cluster(clusterName="production")
+
+    ecs_client.register_task_definition(
+        family="web-api-task",
+        containerDefinitions=[
+            {
+                "name": "web",
+                "image": "nginx",
+                "memory": 256,
+                "logConfiguration": {
+                    "logDriver": "awslogs",
+                    "options": {"awslogs-group": "/ecs/production/web", "awslogs-stream-prefix": "ecs"},
                 },
-            ],
-        )
+            },
+        ],
+    )
 
-        client.create_service(
-            cluster="production",
-            serviceName="web-api",
-            taskDefinition="web-api-task",
-            desiredCount=3,
-        )
+    ecs_client.create_service(
+        cluster="production",
+        serviceName="web-api",
+        taskDefinition="web-api-task",
+        desiredCount=3,
+    )
 
-        client.run_task(
-            cluster="production",
-            taskDefinition="web-api-task",
-            count=2,
-            launchType="FARGATE",
-            networkConfiguration={
-                "awsvpcConfiguration": {
-                    "subnets": ["subnet-12345"],
-                    "assignPublicIp": "ENABLED",
-                },
+    ecs_client.run_task(
+        cluster="production",
+        taskDefinition="web-api-task",
+        count=2,
+        launchType="FARGATE",
+        networkConfiguration={
+            "awsvpcConfiguration": {
+                "subnets": ["subnet-12345"],
+                "assignPublicIp": "ENABLED",
             },
-        )
+        },
+    )
 
-        yield client
+    return ecs_client
 
 
 @pytest.fixture
-def ecs_client_with_env_vars():
-    with mock_aws():
-        client = boto3.client("ecs", region_name="us-east-1")
-
-        client.create_cluster(clusterName="production")
-
-        client.register_task_definition(
-            family="app-with-env",
-            containerDefinitions=[
-                {
-                    "name": "app",
-                    "image": "myapp:latest",
-                    "memory": 512,
-                    "environment": [
-                        {"name": "ENV", "value": "production"},
-                        {"name": "DEBUG", "value": "false"},
-                        {"name": "DATABASE_URL", "value": "postgres://prod-db:5432/myapp"},
-                        {"name": "API_KEY", "value": "secret-key-123"},
-                    ],
-                },
-                {
-                    "name": "sidecar",
-                    "image": "nginx:latest",
-                    "memory": 256,
-                    "environment": [
-                        {"name": "NGINX_PORT", "value": "8080"},
-                    ],
-                },
-            ],
-        )
+def ecs_client_with_env_vars(ecs_client):
+    ecs_client.create_cluster(clusterName="production")
 
-        client.create_service(
-            cluster="production",
-            serviceName="app-service",
-            taskDefinition="app-with-env",
-            desiredCount=1,
-        )
+    ecs_client.register_task_definition(
+        family="app-with-env",
+        containerDefinitions=[
+            {
+                "name": "app",
+                "image": "myapp:latest",
+                "memory": 512,
+                "environment": [
+                    {"name": "ENV", "value": "production"},
+                    {"name": "DEBUG", "value": "false"},
+                    {"name": "DATABASE_URL", "value": "postgres://prod-db:5432/myapp"},
+                    {"name": "API_KEY", "value": "secret-key-123"},
+                ],
+            },
+            {
+                "name": "sidecar",
+                "image": "nginx:latest",
+                "memory": 256,
+                "environment": [
+                    {"name": "NGINX_PORT", "value": "8080"},
+                ],
+            },
+        ],
+    )
 
-        client.run_task(
-            cluster="production",
-            taskDefinition="app-with-env",
-            launchType="FARGATE",
-        )
+    ecs_client.create_service(
+        cluster="production",
+        serviceName="app-service",
+        taskDefinition="app-with-env",
+        desiredCount=1,
+    )
+
+    ecs_client.run_task(
+        cluster="production",
+        taskDefinition="app-with-env",
+        launchType="FARGATE",
+    )
 
-        yield client
+    return ecs_client
 
 
 @pytest.fixture
-def ecs_client_with_secrets():
-    with mock_aws():
-        client = boto3.client("ecs", region_name="us-east-1")
-
-        client.create_cluster(clusterName="production")
-
-        client.register_task_definition(
-            family="app-with-secrets",
-            containerDefinitions=[
-                {
-                    "name": "app",
-                    "image": "myapp:latest",
-                    "memory": 512,
-                    "environment": [
-                        {"name": "ENV", "value": "production"},
-                    ],
-                    "secrets": [
-                        {
-                            "name": "DATABASE_PASSWORD",
-                            "valueFrom": "arn:aws:secretsmanager:us-east-1:123456789012:secret:db-password-AbCdEf",
-                        },
-                        {
-                            "name": "API_KEY",
-                            "valueFrom": "arn:aws:secretsmanager:us-east-1:123456789012:secret:api-key-XyZ123",
-                        },
-                    ],
-                },
-                {
-                    "name": "sidecar",
-                    "image": "nginx:latest",
-                    "memory": 256,
-                    "secrets": [
-                        {
-                            "name": "SSL_CERT",
-                            "valueFrom": "arn:aws:secretsmanager:us-east-1:123456789012:secret:ssl-cert-MnOpQr",
-                        },
-                    ],
-                },
-            ],
-        )
+def ecs_client_with_secrets(ecs_client):
+    ecs_client.create_cluster(clusterName="production")
 
-        client.create_service(
-            cluster="production",
-            serviceName="app-service",
-            taskDefinition="app-with-secrets",
-            desiredCount=1,
-        )
+    ecs_client.register_task_definition(
+        family="app-with-secrets",
+        containerDefinitions=[
+            {
+                "name": "app",
+                "image": "myapp:latest",
+                "memory": 512,
+                "environment": [
+                    {"name": "ENV", "value": "production"},
+                ],
+                "secrets": [
+                    {
+                        "name": "DATABASE_PASSWORD",
+                        "valueFrom": "arn:aws:secretsmanager:us-east-1:123456789012:secret:db-password-AbCdEf",
+                    },
+                    {
+                        "name": "API_KEY",
+                        "valueFrom": "arn:aws:secretsmanager:us-east-1:123456789012:secret:api-key-XyZ123",
+                    },
+                ],
+            },
+            {
+                "name": "sidecar",
+                "image": "nginx:latest",
+                "memory": 256,
+                "secrets": [
+                    {
+                        "name": "SSL_CERT",
+                        "valueFrom": "arn:aws:secretsmanager:us-east-1:123456789012:secret:ssl-cert-MnOpQr",
+                    },
+                ],
+            },
+        ],
+    )
 
-        client.run_task(
-            cluster="production",
-            taskDefinition="app-with-secrets",
-            launchType="FARGATE",
-        )
+    ecs_client.create_service(
+        cluster="production",
+        serviceName="app-service",
+        taskDefinition="app-with-secrets",
+        desiredCount=1,
+    )
+
+    ecs_client.run_task(
+        cluster="production",
+        taskDefinition="app-with-secrets",
+        launchType="FARGATE",
+    )
 
-        yield client
+    return ecs_client
 
 
 def test_get_cluster_names(ecs_client_with_clusters) -> None:
@@ -203,27 +186,22 @@ def test_get_cluster_names(ecs_client_with_clusters) -> None:
     assert sorted(clusters) == sorted(expected)
 
 
-def test_get_cluster_names_empty():
-    with mock_aws():
-        client = boto3.client("ecs", region_name="us-east-1")
-        service = ECSService(client)
-        clusters = service.get_cluster_names()
-        assert clusters == []
-
+def test_get_cluster_names_empty(ecs_client):
+    service = ECSService(ecs_client)
+    clusters = service.get_cluster_names()
+    assert clusters == []
 
-def test_get_cluster_names_pagination():
-    with mock_aws():
-        client = boto3.client("ecs", region_name="us-east-1")
 
-        for i in range(150):
-            client.create_cluster(clusterName=f"cluster-{i:03d}")
+def test_get_cluster_names_pagination(ecs_client):
+    for i in range(150):
+        ecs_client.create_cluster(clusterName=f"cluster-{i:03d}")
 
-        service = ECSService(client)
-        clusters = service.get_cluster_names()
+    service = ECSService(ecs_client)
+    clusters = service.get_cluster_names()
 
-        assert len(clusters) == 150
-        assert "cluster-000" in clusters
-        assert "cluster-149" in clusters
+    assert len(clusters) == 150
+    assert "cluster-000" in clusters
+    assert "cluster-149" in clusters
 
 
 def test_get_services(ecs_client_with_services) -> None:
@@ -234,30 +212,28 @@ def test_get_services(ecs_client_with_services) -> None:
     assert sorted(services) == sorted(expected)
 
 
-def test_get_services_pagination():
-    with mock_aws():
-        client = boto3.client("ecs", region_name="us-east-1")
-        client.create_cluster(clusterName="production")
+def test_get_services_pagination(ecs_client):
+    ecs_client.create_cluster(clusterName="production")
 
-        client.register_task_definition(
-            family="app-task",
-            containerDefinitions=[{"name": "app", "image": "nginx", "memory": 256}],
-        )
+    ecs_client.register_task_definition(
+        family="app-task",
+        containerDefinitions=[{"name": "app", "image": "nginx", "memory": 256}],
+    )
 
-        for i in range(200):
-            client.create_service(
-                cluster="production",
-                serviceName=f"service-{i:03d}",
-                taskDefinition="app-task",
-                desiredCount=1,
-            )
+    for i in range(200):
+        ecs_client.create_service(
+            cluster="production",
+            serviceName=f"service-{i:03d}",
+            taskDefinition="app-task",
+            desiredCount=1,
+        )
 
-        service = ECSService(client)
-        services = service.get_services("production")
+    service = ECSService(ecs_client)
+    services = service.get_services("production")
 
-        assert len(services) == 200
-        assert "service-000" in services
-        assert "service-199" in services
+    assert len(services) == 200
+    assert "service-000" in services
+    assert "service-199" in services
 
 
 def test_get_service_info(ecs_client_with_services) -> None:
@@ -274,30 +250,28 @@ def test_get_service_info(ecs_client_with_services) -> None:
         assert "pending_count" in info
 
 
-def test_get_service_info_with_more_than_10_services():
-    with mock_aws():
-        client = boto3.client("ecs", region_name="us-east-1")
-        client.create_cluster(clusterName="production")
+def test_get_service_info_with_more_than_10_services(ecs_client):
+    ecs_client.create_cluster(clusterName="production")
 
-        client.register_task_definition(
-            family="app-task",
-            containerDefinitions=[{"name": "app", "image": "nginx", "memory": 256}],
-        )
+    ecs_client.register_task_definition(
+        family="app-task",
+        containerDefinitions=[{"name": "app", "image": "nginx", "memory": 256}],
+    )
 
-        for i in range(15):
-            client.create_service(
-                cluster="production",
-                serviceName=f"service-{i:02d}",
-                taskDefinition="app-task",
-                desiredCount=2,
-            )
+    for i in range(15):
+        ecs_client.create_service(
+            cluster="production",
+            serviceName=f"service-{i:02d}",
+            taskDefinition="app-task",
+            desiredCount=2,
+        )
 
-        service = ECSService(client)
-        service_info = service.get_service_info("production")
+    service = ECSService(ecs_client)
+    service_info = service.get_service_info("production")
 
-        assert len(service_info) == 15
-        service_names = {info["name"] for info in service_info}
-        assert all(any(f"service-{i:02d}" in name for name in service_names) for i in range(15))
+    assert len(service_info) == 15
+    service_names = {info["name"] for info in service_info}
+    assert all(any(f"service-{i:02d}" in name for name in service_names) for i in range(15))
 
 
 def test_get_tasks(ecs_client_with_tasks) -> None:
@@ -340,44 +314,42 @@ def test_get_task_info(ecs_client_with_tasks) -> None:
         assert "images" in info
 
 
-def test_get_task_info_with_more_than_100_tasks():
-    with mock_aws():
-        client = boto3.client("ecs", region_name="us-east-1")
-        client.create_cluster(clusterName="production")
+def test_get_task_info_with_more_than_100_tasks(ecs_client):
+    ecs_client.create_cluster(clusterName="production")
 
-        client.register_task_definition(
-            family="app-task",
-            containerDefinitions=[{"name": "app", "image": "nginx", "memory": 256}],
-        )
+    ecs_client.register_task_definition(
+        family="app-task",
+        containerDefinitions=[{"name": "app", "image": "nginx", "memory": 256}],
+    )
+
+    ecs_client.create_service(
+        cluster="production",
+        serviceName="app-service",
+        taskDefinition="app-task",
+        desiredCount=150,
+    )
 
-        client.create_service(
+    for _ in range(150):
+        ecs_client.run_task(
             cluster="production",
-            serviceName="app-service",
             taskDefinition="app-task",
-            desiredCount=150,
+            launchType="FARGATE",
+            networkConfiguration={
+                "awsvpcConfiguration": {
+                    "subnets": ["subnet-12345"],
+                    "assignPublicIp": "ENABLED",
+                }
+            },
         )
 
-        for _ in range(150):
-            client.run_task(
-                cluster="production",
-                taskDefinition="app-task",
-                launchType="FARGATE",
-                networkConfiguration={
-                    "awsvpcConfiguration": {
-                        "subnets": ["subnet-12345"],
-                        "assignPublicIp": "ENABLED",
-                    }
-                },
-            )
-
-        service = ECSService(client)
-        task_info = service.get_task_info("production", "app-service")
+    service = ECSService(ecs_client)
+    task_info = service.get_task_info("production", "app-service")
 
-        assert len(task_info) == 150
-        for info in task_info:
-            assert "name" in info
-            assert "value" in info
-            assert "task_def_arn" in info
+    assert len(task_info) == 150
+    for info in task_info:
+        assert "name" in info
+        assert "value" in info
+        assert "task_def_arn" in info
 
 
 def test_get_task_details(ecs_client_with_tasks) -> None:
@@ -410,36 +382,34 @@ def test_get_log_config(ecs_client_with_tasks) -> None:
     assert log_config["log_stream"].startswith("ecs/web/")
 
 
-def test_get_log_config_no_config():
-    with mock_aws():
-        client = boto3.client("ecs", region_name="us-east-1")
-        client.create_cluster(clusterName="production")
+def test_get_log_config_no_config(ecs_client):
+    ecs_client.create_cluster(clusterName="production")
 
-        client.register_task_definition(
-            family="web-api-task",
-            containerDefinitions=[{"name": "web", "image": "nginx", "memory": 256}],  # No log config
-        )
+    ecs_client.register_task_definition(
+        family="web-api-task",
+        containerDefinitions=[{"name": "web", "image": "nginx", "memory": 256}],  # No log config
+    )
 
-        client.run_task(
-            cluster="production",
-            taskDefinition="web-api-task",
-            count=1,
-            launchType="FARGATE",
-            networkConfiguration={
-                "awsvpcConfiguration": {
-                    "subnets": ["subnet-12345"],
-                    "assignPublicIp": "ENABLED",
-                },
+    ecs_client.run_task(
+        cluster="production",
+        taskDefinition="web-api-task",
+        count=1,
+        launchType="FARGATE",
+        networkConfiguration={
+            "awsvpcConfiguration": {
+                "subnets": ["subnet-12345"],
+                "assignPublicIp": "ENABLED",
             },
-        )
+        },
+    )
 
-        # List tasks directly since we didn't create a service
-        response = client.list_tasks(cluster="production")
-        tasks = response.get("taskArns", [])
+    # List tasks directly since we didn't create a service
+    response = ecs_client.list_tasks(cluster="production")
+    tasks = response.get("taskArns", [])
 
-        service = ECSService(client)
-        log_config = service.get_log_config("production", tasks[0], "web")
-        assert log_config is None
+    service = ECSService(ecs_client)
+    log_config = service.get_log_config("production", tasks[0], "web")
+    assert log_config is None
 
 
 def test_get_container_environment_variables(ecs_client_with_env_vars) -> None:
@@ -472,92 +442,86 @@ def test_get_container_environment_variables_sidecar(ecs_client_with_env_vars) -
     assert env_vars["NGINX_PORT"] == "8080"
 
 
-def test_get_container_environment_variables_no_container() -> None:
-    with mock_aws():
-        client = boto3.client("ecs", region_name="us-east-1")
-        client.create_cluster(clusterName="production")
+def test_get_container_environment_variables_no_container(ecs_client) -> None:
+    ecs_client.create_cluster(clusterName="production")
 
-        client.register_task_definition(
-            family="simple-task",
-            containerDefinitions=[{"name": "web", "image": "nginx", "memory": 256}],
-        )
+    ecs_client.register_task_definition(
+        family="simple-task",
+        containerDefinitions=[{"name": "web", "image": "nginx", "memory": 256}],
+    )
 
-        client.run_task(cluster="production", taskDefinition="simple-task", launchType="FARGATE")
+    ecs_client.run_task(cluster="production", taskDefinition="simple-task", launchType="FARGATE")
 
-        response = client.list_tasks(cluster="production")
-        tasks = response.get("taskArns", [])
+    response = ecs_client.list_tasks(cluster="production")
+    tasks = response.get("taskArns", [])
 
-        service = ECSService(client)
-        env_vars = service.get_container_environment_variables("production", tasks[0], "nonexistent")
-        assert env_vars is None
+    service = ECSService(ecs_client)
+    env_vars = service.get_container_environment_variables("production", tasks[0], "nonexistent")
+    assert env_vars is None
 
 
-def test_get_container_environment_variables_no_env_vars() -> None:
-    with mock_aws():
-        client = boto3.client("ecs", region_name="us-east-1")
-        client.create_cluster(clusterName="production")
+def test_get_container_environment_variables_no_env_vars(ecs_client) -> None:
+    ecs_client.create_cluster(clusterName="production")
 
-        client.register_task_definition(
-            family="simple-task",
-            containerDefinitions=[{"name": "web", "image": "nginx", "memory": 256}],
-        )
+    ecs_client.register_task_definition(
+        family="simple-task",
+        containerDefinitions=[{"name": "web", "image": "nginx", "memory": 256}],
+    )
 
-        client.run_task(cluster="production", taskDefinition="simple-task", launchType="FARGATE")
+    ecs_client.run_task(cluster="production", taskDefinition="simple-task", launchType="FARGATE")
 
-        response = client.list_tasks(cluster="production")
-        tasks = response.get("taskArns", [])
+    response = ecs_client.list_tasks(cluster="production")
+    tasks = response.get("taskArns", [])
 
-        service = ECSService(client)
-        env_vars = service.get_container_environment_variables("production", tasks[0], "web")
-        assert env_vars == {}
+    service = ECSService(ecs_client)
+    env_vars = service.get_container_environment_variables("production", tasks[0], "web")
+    assert env_vars == {}
 
 
 @pytest.fixture
-def ecs_client_with_volume_mounts():
+def ecs_client_with_volume_mounts(ecs_client):
     """Create a mocked ECS client with tasks containing volume mounts."""
-    with mock_aws():
-        client = boto3.client("ecs", region_name="us-east-1")
-        client.create_cluster(clusterName="production")
-
-        client.register_task_definition(
-            family="app-with-volumes-task",
-            volumes=[
-                {"name": "data-volume", "host": {"sourcePath": "/opt/data"}},
-                {"name": "logs-volume", "host": {"sourcePath": "/var/log/app"}},
-                {"name": "config-volume"},  # Empty volume
-            ],
-            containerDefinitions=[
-                {
-                    "name": "app",
-                    "image": "myapp:latest",
-                    "memory": 512,
-                    "mountPoints": [
-                        {"sourceVolume": "data-volume", "containerPath": "/app/data", "readOnly": False},
-                        {"sourceVolume": "logs-volume", "containerPath": "/app/logs", "readOnly": False},
-                        {"sourceVolume": "config-volume", "containerPath": "/app/config", "readOnly": True},
-                    ],
-                },
-                {
-                    "name": "sidecar",
-                    "image": "sidecar:latest",
-                    "memory": 256,
-                    "mountPoints": [
-                        {"sourceVolume": "logs-volume", "containerPath": "/shared/logs", "readOnly": True},
-                    ],
-                },
-                {
-                    "name": "no-mounts",
-                    "image": "simple:latest",
-                    "memory": 128,
-                    "mountPoints": [],
-                },
-            ],
-        )
+    ecs_client.create_cluster(clusterName="production")
+
+    ecs_client.register_task_definition(
+        family="app-with-volumes-task",
+        volumes=[
+            {"name": "data-volume", "host": {"sourcePath": "/opt/data"}},
+            {"name": "logs-volume", "host": {"sourcePath": "/var/log/app"}},
+            {"name": "config-volume"},  # Empty volume
+        ],
+        containerDefinitions=[
+            {
+                "name": "app",
+                "image": "myapp:latest",
+                "memory": 512,
+                "mountPoints": [
+                    {"sourceVolume": "data-volume", "containerPath": "/app/data", "readOnly": False},
+                    {"sourceVolume": "logs-volume", "containerPath": "/app/logs", "readOnly": False},
+                    {"sourceVolume": "config-volume", "containerPath": "/app/config", "readOnly": True},
+                ],
+            },
+            {
+                "name": "sidecar",
+                "image": "sidecar:latest",
+                "memory": 256,
+                "mountPoints": [
+                    {"sourceVolume": "logs-volume", "containerPath": "/shared/logs", "readOnly": True},
+                ],
+            },
+            {
+                "name": "no-mounts",
+                "image": "simple:latest",
+                "memory": 128,
+                "mountPoints": [],
+            },
+        ],
+    )
 
-        client.create_service(cluster="production", serviceName="app-service", taskDefinition="app-with-volumes-task")
-        client.run_task(cluster="production", taskDefinition="app-with-volumes-task", launchType="FARGATE")
+    ecs_client.create_service(cluster="production", serviceName="app-service", taskDefinition="app-with-volumes-task")
+    ecs_client.run_task(cluster="production", taskDefinition="app-with-volumes-task", launchType="FARGATE")
 
-        yield client
+    return ecs_client
 
 
 def test_get_container_volume_mounts(ecs_client_with_volume_mounts) -> None:
@@ -653,52 +617,46 @@ def test_get_container_secrets_sidecar(ecs_client_with_secrets) -> None:
     assert secrets["SSL_CERT"] == "arn:aws:secretsmanager:us-east-1:123456789012:secret:ssl-cert-MnOpQr"
 
 
-def test_get_container_secrets_no_container() -> None:
-    with mock_aws():
-        client = boto3.client("ecs", region_name="us-east-1")
-        client.create_cluster(clusterName="production")
+def test_get_container_secrets_no_container(ecs_client) -> None:
+    ecs_client.create_cluster(clusterName="production")
 
-        client.register_task_definition(
-            family="simple-task",
-            containerDefinitions=[{"name": "web", "image": "nginx", "memory": 256}],
-        )
+    ecs_client.register_task_definition(
+        family="simple-task",
+        containerDefinitions=[{"name": "web", "image": "nginx", "memory": 256}],
+    )
 
-        client.run_task(cluster="production", taskDefinition="simple-task", launchType="FARGATE")
+    ecs_client.run_task(cluster="production", taskDefinition="simple-task", launchType="FARGATE")
 
-        response = client.list_tasks(cluster="production")
-        tasks = response.get("taskArns", [])
+    response = ecs_client.list_tasks(cluster="production")
+    tasks = response.get("taskArns", [])
 
-        service = ECSService(client)
-        secrets = service.get_container_secrets("production", tasks[0], "nonexistent")
-        assert secrets is None
+    service = ECSService(ecs_client)
+    secrets = service.get_container_secrets("production", tasks[0], "nonexistent")
+    assert secrets is None
 
 
-def test_get_container_secrets_no_secrets() -> None:
-    with mock_aws():
-        client = boto3.client("ecs", region_name="us-east-1")
-        client.create_cluster(clusterName="production")
+def test_get_container_secrets_no_secrets(ecs_client) -> None:
+    ecs_client.create_cluster(clusterName="production")
 
-        client.register_task_definition(
-            family="simple-task",
-            containerDefinitions=[{"name": "web", "image": "nginx", "memory": 256}],
-        )
+    ecs_client.register_task_definition(
+        family="simple-task",
+        containerDefinitions=[{"name": "web", "image": "nginx", "memory": 256}],
+    )
 
-        client.run_task(cluster="production", taskDefinition="simple-task", launchType="FARGATE")
+    ecs_client.run_task(cluster="production", taskDefinition="simple-task", launchType="FARGATE")
 
-        response = client.list_tasks(cluster="production")
-        tasks = response.get("taskArns", [])
+    response = ecs_client.list_tasks(cluster="production")
+    tasks = response.get("taskArns", [])
 
-        service = ECSService(client)
-        secrets = service.get_container_secrets("production", tasks[0], "web")
-        assert secrets == {}
+    service = ECSService(ecs_client)
+    secrets = service.get_container_secrets("production", tasks[0], "web")
+    assert secrets == {}
 
 
-@mock_aws
-def test_get_container_port_mappings_success() -> None:
-    client = boto3.client("ecs", region_name="us-east-1")
-    client.create_cluster(clusterName="production")
+def test_get_container_port_mappings_success(ecs_client) -> None:
+    ecs_client.create_cluster(clusterName="production")
 
-    client.register_task_definition(
+    ecs_client.register_task_definition(
         family="web-task",
         containerDefinitions=[
             {
@@ -713,11 +671,11 @@ def test_get_container_port_mappings_success() -> None:
         ],
     )
 
-    client.run_task(cluster="production", taskDefinition="web-task", launchType="FARGATE")
-    response = client.list_tasks(cluster="production")
+    ecs_client.run_task(cluster="production", taskDefinition="web-task", launchType="FARGATE")
+    response = ecs_client.list_tasks(cluster="production")
     tasks = response.get("taskArns", [])
 
-    service = ECSService(client)
+    service = ECSService(ecs_client)
     port_mappings = service.get_container_port_mappings("production", tasks[0], "web")
 
     assert port_mappings is not None
@@ -729,75 +687,67 @@ def test_get_container_port_mappings_success() -> None:
     assert port_mappings[1]["hostPort"] == 0
 
 
-@mock_aws
-def test_get_container_port_mappings_no_mappings() -> None:
-    client = boto3.client("ecs", region_name="us-east-1")
-    client.create_cluster(clusterName="production")
+def test_get_container_port_mappings_no_mappings(ecs_client) -> None:
+    ecs_client.create_cluster(clusterName="production")
 
-    client.register_task_definition(
+    ecs_client.register_task_definition(
         family="simple-task",
         containerDefinitions=[{"name": "web", "image": "nginx", "memory": 256}],
     )
 
-    client.run_task(cluster="production", taskDefinition="simple-task", launchType="FARGATE")
-    response = client.list_tasks(cluster="production")
+    ecs_client.run_task(cluster="production", taskDefinition="simple-task", launchType="FARGATE")
+    response = ecs_client.list_tasks(cluster="production")
     tasks = response.get("taskArns", [])
 
-    service = ECSService(client)
+    service = ECSService(ecs_client)
     port_mappings = service.get_container_port_mappings("production", tasks[0], "web")
 
     assert port_mappings == []
 
 
-@mock_aws
-def test_get_container_port_mappings_container_not_found() -> None:
-    client = boto3.client("ecs", region_name="us-east-1")
-    client.create_cluster(clusterName="production")
+def test_get_container_port_mappings_container_not_found(ecs_client) -> None:
+    ecs_client.create_cluster(clusterName="production")
 
-    client.register_task_definition(
+    ecs_client.register_task_definition(
         family="simple-task",
         containerDefinitions=[{"name": "web", "image": "nginx", "memory": 256}],
     )
 
-    client.run_task(cluster="production", taskDefinition="simple-task", launchType="FARGATE")
-    response = client.list_tasks(cluster="production")
+    ecs_client.run_task(cluster="production", taskDefinition="simple-task", launchType="FARGATE")
+    response = ecs_client.list_tasks(cluster="production")
     tasks = response.get("taskArns", [])
 
-    service = ECSService(client)
+    service = ECSService(ecs_client)
     port_mappings = service.get_container_port_mappings("production", tasks[0], "nonexistent")
 
     assert port_mappings is None
 
 
-@mock_aws
-def test_force_new_deployment_success() -> None:
-    client = boto3.client("ecs", region_name="us-east-1")
-    client.create_cluster(clusterName="production")
+def test_force_new_deployment_success(ecs_client) -> None:
+    ecs_client.create_cluster(clusterName="production")
 
-    client.register_task_definition(
+    ecs_client.register_task_definition(
         family="web-task",
         containerDefinitions=[{"name": "web", "image": "nginx", "memory": 256}],
     )
 
-    client.create_service(
+    ecs_client.create_service(
         cluster="production",
         serviceName="web-service",
         taskDefinition="web-task",
         desiredCount=1,
     )
 
-    service = ECSService(client)
+    service = ECSService(ecs_client)
     result = service.force_new_deployment("production", "web-service")
 
     assert result == (True, None)
 
 
-@mock_aws
-def test_force_new_deployment_service_not_found() -> None:
-    client = boto3.client("ecs", region_name="us-east-1")
-    client.create_cluster(clusterName="production")
+def test_force_new_deployment_service_not_found(ecs_client) -> None:
+    ecs_client.create_cluster(clusterName="production")
 
-    service = ECSService(client)
+    service = ECSService(ecs_client)
     success, error = service.force_new_deployment("production", "nonexistent-service")
 
     assert success is False
@@ -806,35 +756,31 @@ def test_force_new_deployment_service_not_found() -> None:
 
 
 @pytest.fixture
-def ecs_client_with_service_events():
+def ecs_client_with_service_events(ecs_client):
     """Create a mocked ECS client with service events."""
-    with mock_aws():
-        client = boto3.client("ecs", region_name="us-east-1")
-        client.create_cluster(clusterName="production")
+    ecs_client.create_cluster(clusterName="production")
 
-        client.register_task_definition(
-            family="web-task",
-            containerDefinitions=[{"name": "web", "image": "nginx", "memory": 256}],
-        )
+    ecs_client.register_task_definition(
+        family="web-task",
+        containerDefinitions=[{"name": "web", "image": "nginx", "memory": 256}],
+    )
 
-        client.create_service(
-            cluster="production",
-            serviceName="web-service",
-            taskDefinition="web-task",
-            desiredCount=2,
-        )
+    ecs_client.create_service(
+        cluster="production",
+        serviceName="web-service",
+        taskDefinition="web-task",
+        desiredCount=2,
+    )
 
-        yield client
+    return ecs_client
 
 
-def test_get_service_events_empty_service():
-    with mock_aws():
-        client = boto3.client("ecs", region_name="us-east-1")
-        client.create_cluster(clusterName="production")
+def test_get_service_events_empty_service(ecs_client):
+    ecs_client.create_cluster(clusterName="production")
 
-        service = ECSService(client)
-        events = service.get_service_events("production", "nonexistent-service")
-        assert events == []
+    service = ECSService(ecs_client)
+    events = service.get_service_events("production", "nonexistent-service")
+    assert events == []
 
 
 def test_get_service_events_no_events(ecs_client_with_service_events):
@@ -118,7 +118,8 @@ def test_create_aws_client_without_profile():
         assert mock_client.call_count == 1
         args, kwargs = mock_client.call_args
         assert args[0] == "ecs"
-        assert "config" in kwargs
+        assert kwargs["config"].max_pool_connections == 10
+        assert kwargs["config"].retries == {"max_attempts": 5, "mode": "adaptive"}
 
 
 def test_create_aws_client_with_profile():
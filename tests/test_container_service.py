@@ -11,11 +11,12 @@ from lazy_ecs.features.container.container import (
     build_log_group_arn,
     build_log_stream_name,
 )
+from lazy_ecs.features.task.task import TaskService
 
 
 @pytest.fixture
 def mock_task_service():
-    return Mock()
+    return Mock(spec=TaskService)
 
 
 @pytest.fixture
@@ -8,11 +8,20 @@ import pytest
 from lazy_ecs.features.container.container import ContainerService, LiveTailError
 from lazy_ecs.features.container.models import Action
 from lazy_ecs.features.container.ui import ContainerUI
+from lazy_ecs.features.task.task import TaskService
+
+CONTAINER_DETAIL_METHODS = [
+    ("show_container_environment_variables", "get_environment_variables"),
+    ("show_container_secrets", "get_secrets"),
+    ("show_container_port_mappings", "get_port_mappings"),
+    ("show_container_volume_mounts", "get_volume_mounts"),
+]
+ENV_METHODS, SECRETS_METHODS, PORT_METHODS, VOLUME_METHODS = CONTAINER_DETAIL_METHODS
 
 
 @pytest.fixture
 def mock_task_service():
-    return Mock()
+    return Mock(spec=TaskService)
 
 
 @pytest.fixture
@@ -204,8 +213,7 @@ def test_display_logs_with_tail_prints_event_before_reader_done(container_ui):
         action = container_ui._display_logs_with_tail("web-container", "test-log-group", "test-stream", "", 50)
 
     assert action == Action.STOP
-    printed_messages = [str(call.args[0]) for call in mock_console_print.call_args_list if call.args]
-    assert any("tail-message" in message for message in printed_messages)
+    assert any(call.args and "tail-message" in str(call.args[0]) for call in mock_console_print.call_args_list)
 
 
 def test_get_container_logs_filtered(mock_ecs_client, mock_task_service):
@@ -230,198 +238,99 @@ def test_get_container_logs_filtered(mock_ecs_client, mock_task_service):
     )
 
 
-def test_show_container_environment_variables_success(container_ui):
-    """Test displaying container environment variables successfully."""
-    context = {"container_definition": {"environment": [{"name": "ENV_VAR", "value": "value"}]}}
-    env_vars = {"ENV_VAR": "value", "ANOTHER_VAR": "another_value"}
-
-    container_ui.container_service.get_container_context = Mock(return_value=context)
-    container_ui.container_service.get_environment_variables = Mock(return_value=env_vars)
-
-    container_ui.show_container_environment_variables("test-cluster", "task-arn", "web-container")
-
-    container_ui.container_service.get_container_context.assert_called_once_with(
-        "test-cluster",
-        "task-arn",
-        "web-container",
-    )
-    container_ui.container_service.get_environment_variables.assert_called_once_with(context)
-
-
-def test_show_container_environment_variables_no_context(container_ui):
-    """Test displaying environment variables with no container context."""
-    container_ui.container_service.get_container_context = Mock(return_value=None)
-
-    container_ui.show_container_environment_variables("test-cluster", "task-arn", "web-container")
-
-    container_ui.container_service.get_container_context.assert_called_once_with(
-        "test-cluster",
-        "task-arn",
-        "web-container",
-    )
-
-
-def test_show_container_environment_variables_empty(container_ui):
-    """Test displaying container environment variables when empty."""
-    context = {"container_definition": {"environment": []}}
-
-    container_ui.container_service.get_container_context = Mock(return_value=context)
-    container_ui.container_service.get_environment_variables = Mock(return_value={})
-
-    container_ui.show_container_environment_variables("test-cluster", "task-arn", "web-container")
-
-    container_ui.container_service.get_container_context.assert_called_once_with(
-        "test-cluster",
-        "task-arn",
-        "web-container",
-    )
-    container_ui.container_service.get_environment_variables.assert_called_once_with(context)
-
-
-def test_show_container_secrets_success(container_ui):
-    """Test displaying container secrets successfully."""
-    context = {"container_definition": {"secrets": []}}
-    secrets = {
-        "SECRET_KEY": "arn:aws:secretsmanager:us-east-1:123:secret:test",
-        "PARAM_KEY": "arn:aws:ssm:us-east-1:123:parameter/test",
-    }
-
+@pytest.mark.parametrize(
+    ("ui_method", "service_method", "items", "expected_lines"),
+    [
+        pytest.param(
+            *ENV_METHODS,
+            {"ENV_VAR": "value", "ANOTHER_VAR": "another_value"},
+            ["ENV_VAR=value", "ANOTHER_VAR=another_value", "📊 Total: 2 environment variables"],
+            id="env-success",
+        ),
+        pytest.param(
+            *ENV_METHODS,
+            {},
+            ["📝 No environment variables found for container 'web-container'"],
+            id="env-empty",
+        ),
+        pytest.param(
+            *SECRETS_METHODS,
+            {
+                "SECRET_KEY": "arn:aws:secretsmanager:us-east-1:123:secret:test",
+                "PARAM_KEY": "arn:aws:ssm:us-east-1:123:parameter/test",
+            },
+            [
+                "SECRET_KEY → Secrets Manager: test",
+                "PARAM_KEY → Parameter Store: test",
+                "🔒 Total: 2 secrets configured",
+            ],
+            id="secrets-success",
+        ),
+        pytest.param(
+            *SECRETS_METHODS,
+            {},
+            ["🔐 No secrets configured for container 'web-container'"],
+            id="secrets-empty",
+        ),
+        pytest.param(
+            *PORT_METHODS,
+            [{"containerPort": 8080, "hostPort": 80, "protocol": "tcp"}],
+            ["Container: 8080 → Host: 80 (tcp)", "🔗 Total: 1 port mappings"],
+            id="ports-success",
+        ),
+        pytest.param(
+            *PORT_METHODS,
+            [],
+            ["🌐 No port mappings configured for container 'web-container'"],
+            id="ports-empty",
+        ),
+        pytest.param(
+            *VOLUME_METHODS,
+            [{"source_volume": "data-vol", "container_path": "/data", "read_only": False, "host_path": "/host/data"}],
+            ["Volume: data-vol → /data (RW)", "Host path: /host/data", "📂 Total: 1 volume mounts"],
+            id="volumes-success",
+        ),
+        pytest.param(
+            *VOLUME_METHODS,
+            [],
+            ["💾 No volume mounts configured for container 'web-container'"],
+            id="volumes-empty",
+        ),
+    ],
+)
+def test_show_container_details(monkeypatch, container_ui, ui_method, service_method, items, expected_lines):
+    mock_print = Mock()
+    monkeypatch.setattr("lazy_ecs.features.container.ui.console.print", mock_print)
+    context = {"container_definition": {}}
     container_ui.container_service.get_container_context = Mock(return_value=context)
-    container_ui.container_service.get_secrets = Mock(return_value=secrets)
+    setattr(container_ui.container_service, service_method, Mock(return_value=items))
 
-    container_ui.show_container_secrets("test-cluster", "task-arn", "web-container")
+    getattr(container_ui, ui_method)("test-cluster", "task-arn", "web-container")
 
     container_ui.container_service.get_container_context.assert_called_once_with(
         "test-cluster",
         "task-arn",
         "web-container",
     )
-    container_ui.container_service.get_secrets.assert_called_once_with(context)
+    getattr(container_ui.container_service, service_method).assert_called_once_with(context)
+    printed = "\n".join(str(c.args[0]) for c in mock_print.call_args_list)
+    for line in expected_lines:
+        assert line in printed
 
 
-def test_show_container_secrets_no_context(container_ui):
-    """Test displaying secrets with no container context."""
+@pytest.mark.parametrize(("ui_method", "service_method"), CONTAINER_DETAIL_METHODS)
+def test_show_container_details_no_context(monkeypatch, container_ui, ui_method, service_method):
+    mock_print_error = Mock()
+    monkeypatch.setattr("lazy_ecs.features.container.ui.print_error", mock_print_error)
     container_ui.container_service.get_container_context = Mock(return_value=None)
+    setattr(container_ui.container_service, service_method, Mock())
 
-    container_ui.show_container_secrets("test-cluster", "task-arn", "web-container")
-
-    container_ui.container_service.get_container_context.assert_called_once_with(
-        "test-cluster",
-        "task-arn",
-        "web-container",
-    )
-
-
-def test_show_container_secrets_empty(container_ui):
-    """Test displaying container secrets when empty."""
-    context = {"container_definition": {"secrets": []}}
-
-    container_ui.container_service.get_container_context = Mock(return_value=context)
-    container_ui.container_service.get_secrets = Mock(return_value={})
-
-    container_ui.show_container_secrets("test-cluster", "task-arn", "web-container")
-
-    container_ui.container_service.get_container_context.assert_called_once_with(
-        "test-cluster",
-        "task-arn",
-        "web-container",
-    )
-    container_ui.container_service.get_secrets.assert_called_once_with(context)
-
-
-def test_show_container_port_mappings_success(container_ui):
-    """Test displaying container port mappings successfully."""
-    context = {"container_definition": {"portMappings": []}}
-    port_mappings = [{"containerPort": 8080, "hostPort": 80, "protocol": "tcp"}]
-
-    container_ui.container_service.get_container_context = Mock(return_value=context)
-    container_ui.container_service.get_port_mappings = Mock(return_value=port_mappings)
-
-    container_ui.show_container_port_mappings("test-cluster", "task-arn", "web-container")
-
-    container_ui.container_service.get_container_context.assert_called_once_with(
-        "test-cluster",
-        "task-arn",
-        "web-container",
-    )
-    container_ui.container_service.get_port_mappings.assert_called_once_with(context)
-
-
-def test_show_container_port_mappings_no_context(container_ui):
-    """Test displaying port mappings with no container context."""
-    container_ui.container_service.get_container_context = Mock(return_value=None)
-
-    container_ui.show_container_port_mappings("test-cluster", "task-arn", "web-container")
-
-    container_ui.container_service.get_container_context.assert_called_once_with(
-        "test-cluster",
-        "task-arn",
-        "web-container",
-    )
-
-
-def test_show_container_port_mappings_empty(container_ui):
-    """Test displaying container port mappings when empty."""
-    context = {"container_definition": {"portMappings": []}}
-
-    container_ui.container_service.get_container_context = Mock(return_value=context)
-    container_ui.container_service.get_port_mappings = Mock(return_value=[])
-
-    container_ui.show_container_port_mappings("test-cluster", "task-arn", "web-container")
-
-    container_ui.container_service.get_container_context.assert_called_once_with(
-        "test-cluster",
-        "task-arn",
-        "web-container",
-    )
-    container_ui.container_service.get_port_mappings.assert_called_once_with(context)
-
-
-def test_show_container_volume_mounts_success(container_ui):
-    """Test displaying container volume mounts successfully."""
-    context = {"container_definition": {"mountPoints": []}}
-    volume_mounts = [
-        {"source_volume": "data-vol", "container_path": "/data", "read_only": False, "host_path": "/host/data"},
-    ]
-
-    container_ui.container_service.get_container_context = Mock(return_value=context)
-    container_ui.container_service.get_volume_mounts = Mock(return_value=volume_mounts)
-
-    container_ui.show_container_volume_mounts("test-cluster", "task-arn", "web-container")
-
-    container_ui.container_service.get_container_context.assert_called_once_with(
-        "test-cluster",
-        "task-arn",
-        "web-container",
-    )
-    container_ui.container_service.get_volume_mounts.assert_called_once_with(context)
-
-
-def test_show_container_volume_mounts_no_context(container_ui):
-    """Test displaying volume mounts with no container context."""
-    container_ui.container_service.get_container_context = Mock(return_value=None)
-
-    container_ui.show_container_volume_mounts("test-cluster", "task-arn", "web-container")
-
-    container_ui.container_service.get_container_context.assert_called_once_with(
-        "test-cluster",
-        "task-arn",
-        "web-container",
-    )
-
-
-def test_show_container_volume_mounts_empty(container_ui):
-    """Test displaying container volume mounts when empty."""
-    context = {"container_definition": {"mountPoints": []}}
-
-    container_ui.container_service.get_container_context = Mock(return_value=context)
-    container_ui.container_service.get_volume_mounts = Mock(return_value=[])
-
-    container_ui.show_container_volume_mounts("test-cluster", "task-arn", "web-container")
+    getattr(container_ui, ui_method)("test-cluster", "task-arn", "web-container")
 
     container_ui.container_service.get_container_context.assert_called_once_with(
         "test-cluster",
         "task-arn",
         "web-container",
     )
-    container_ui.container_service.get_volume_mounts.assert_called_once_with(context)
+    getattr(container_ui.container_service, service_method).assert_not_called()
+    mock_print_error.assert_called_once_with("Could not find container 'web-container'")
@@ -2,6 +2,8 @@
 
 from unittest.mock import patch
 
+import questionary
+
 from lazy_ecs.core.navigation import (
     add_navigation_choices,
     add_navigation_choices_with_shortcuts,
@@ -90,8 +92,6 @@ def test_add_navigation_choices_with_shortcuts():
     assert len(result) == 3
 
     # Check that we have Choice objects with shortcut keys
-    import questionary
-
     assert isinstance(result[1], questionary.Choice)  # Back option
     assert isinstance(result[2], questionary.Choice)  # Exit option
 
@@ -117,8 +117,6 @@ def test_select_with_navigation_esc_functionality(mock_select):
 
     # Verify choices are Choice objects (not dicts)
     choices_passed = call_kwargs["choices"]
-    import questionary
-
     assert all(isinstance(choice, questionary.Choice) for choice in choices_passed)
 
 
@@ -2,6 +2,8 @@
 
 import time
 
+import pytest
+
 from lazy_ecs.core.utils import (
     batch_items,
     determine_service_status,
@@ -123,24 +125,17 @@ def test_print_info(capsys):
     assert "Informational message" in captured.out
 
 
-def test_batch_items_empty_list():
-    result = list(batch_items([], 5))
-    assert result == []
-
-
-def test_batch_items_single_batch():
-    items = [1, 2, 3]
-    result = list(batch_items(items, 5))
-    assert result == [[1, 2, 3]]
-
-
-def test_batch_items_multiple_batches():
-    items = [1, 2, 3, 4, 5, 6, 7, 8, 9]
-    result = list(batch_items(items, 3))
-    assert result == [[1, 2, 3], [4, 5, 6], [7, 8, 9]]
-
-
-def test_batch_items_partial_last_batch():
-    items = [1, 2, 3, 4, 5, 6, 7]
-    result = list(batch_items(items, 3))
-    assert result == [[1, 2, 3], [4, 5, 6], [7]]
+@pytest.mark.parametrize(
+    ("items", "size", "expected"),
+    [
+        ([1, 2, 3, 4, 5, 6, 7, 8, 9, 10], 3, [[1, 2, 3], [4, 5, 6], [7, 8, 9], [10]]),
+        ([1, 2, 3, 4, 5, 6], 3, [[1, 2, 3], [4, 5, 6]]),
+        ([1, 2, 3], 10, [[1, 2, 3]]),
+        ([], 5, []),
+        ([1, 2, 3, 4, 5], 1, [[1], [2], [3], [4], [5]]),
+        (["a", "b", "c", "d", "e", "f", "g"], 3, [["a", "b", "c"], ["d", "e", "f"], ["g"]]),
+    ],
+    ids=["partial-last-batch", "exact-fit", "single-batch", "empty", "size-one", "strings"],
+)
+def test_batch_items(items, size, expected):
+    assert list(batch_items(items, size)) == expected
@@ -1,8 +1,9 @@
 """Tests for service events functionality."""
 
 from datetime import datetime
+from unittest.mock import Mock
 
-from lazy_ecs.features.service.service import _categorize_event, _parse_service_event
+from lazy_ecs.features.service.service import ServiceService, _categorize_event, _parse_service_event
 
 
 def test_categorize_event_deployment():
@@ -107,11 +108,6 @@ def test_parse_service_event_missing_fields():
 
 def test_service_events_sorted_by_time():
     """Test that service events are sorted by creation time, most recent first."""
-    from datetime import datetime
-    from unittest.mock import Mock
-
-    from lazy_ecs.features.service.service import ServiceService
-
     mock_client = Mock()
     mock_client.describe_services.return_value = {
         "services": [
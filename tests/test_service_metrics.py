@@ -137,8 +137,9 @@ def test_format_metrics_display_returns_formatted_strings():
     lines = format_metrics_display(metrics)
 
     assert len(lines) > 0
-    assert any("CPU" in line for line in lines)
-    assert any("Memory" in line for line in lines)
+    full_output = "\n".join(lines)
+    assert "CPU" in full_output
+    assert "Memory" in full_output
 
 
 def test_format_metrics_display_includes_all_statistics():
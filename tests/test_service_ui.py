@@ -38,7 +38,7 @@ def test_select_service_with_services(mock_select, service_ui):
 
     assert selected == "service:web-api"
     mock_select.assert_called_once()
-    choices = mock_select.call_args[0][1]
+    choices = mock_select.call_args.args[1]
     assert choices[0]["value"] == "service:web-api"
 
 
@@ -64,8 +64,7 @@ def test_select_service_with_many_services(mock_select, service_ui):
     assert selected == "service:service-50"
     mock_select.assert_called_once()
 
-    call_args = mock_select.call_args
-    choices = call_args[0][1]
+    choices = mock_select.call_args.args[1]
     assert len(choices) == 100
     assert choices[50]["value"] == "service:service-50"
 
@@ -123,8 +122,7 @@ def test_select_service_action_with_many_tasks(mock_select, service_ui):
     assert selected == "task:show_details:task-arn-50"
     mock_select.assert_called_once()
 
-    call_args = mock_select.call_args
-    choices = call_args[0][1]
+    choices = mock_select.call_args.args[1]
     assert len(choices) == 104  # 100 tasks + 4 actions (events, metrics, console, deployment)
 
 
@@ -139,8 +137,7 @@ def test_select_service_action_show_events(mock_select, service_ui):
     assert selected == "action:show_events"
     mock_select.assert_called_once()
 
-    call_args = mock_select.call_args
-    choices = call_args[0][1]
+    choices = mock_select.call_args.args[1]
     show_events_choice = next((choice for choice in choices if choice.get("value") == "action:show_events"), None)
     assert show_events_choice is not None
     assert "Show service events" in show_events_choice["name"]
@@ -190,8 +187,7 @@ def test_handle_force_deployment_failure_without_reason(mock_confirm, mock_print
     service_ui.handle_force_deployment("test-cluster", "web-api")
 
     mock_print.assert_any_call("❌ Failed to trigger deployment for 'web-api'", style="red")
-    reason_calls = [call for call in mock_print.call_args_list if call.args and str(call.args[0]).startswith("Reason:")]
-    assert reason_calls == []
+    assert not any(call.args and str(call.args[0]).startswith("Reason:") for call in mock_print.call_args_list)
 
 
 @patch("lazy_ecs.features.service.ui.console.print")
@@ -2,55 +2,50 @@
 
 from __future__ import annotations
 
-import boto3
 import pytest
-from moto import mock_aws
 
 from lazy_ecs.features.task.comparison import TaskComparisonService
 
 
 @pytest.fixture
-def ecs_client_with_task_definitions():
-    with mock_aws():
-        client = boto3.client("ecs", region_name="us-east-1")
-
-        client.register_task_definition(
-            family="my-app",
-            containerDefinitions=[
-                {
-                    "name": "web",
-                    "image": "nginx:1.19",
-                    "memory": 512,
-                    "environment": [{"name": "ENV", "value": "dev"}],
-                },
-            ],
-        )
-
-        client.register_task_definition(
-            family="my-app",
-            containerDefinitions=[
-                {
-                    "name": "web",
-                    "image": "nginx:1.20",
-                    "memory": 512,
-                    "environment": [{"name": "ENV", "value": "staging"}],
-                },
-            ],
-        )
-
-        client.register_task_definition(
-            family="my-app",
-            containerDefinitions=[
-                {
-                    "name": "web",
-                    "image": "nginx:1.21",
-                    "memory": 1024,
-                    "environment": [{"name": "ENV", "value": "production"}],
-                },
-            ],
-        )
-
-        yield client
+def ecs_client_with_task_definitions(ecs_client):
+    ecs_client.register_task_definition(
+        family="my-app",
+        containerDefinitions=[
+            {
+                "name": "web",
+                "image": "nginx:1.19",
+                "memory": 512,
+                "environment": [{"name": "ENV", "value": "dev"}],
+            },
+        ],
+    )
+
+    ecs_client.register_task_definition(
+        family="my-app",
+        containerDefinitions=[
+            {
+                "name": "web",
+                "image": "nginx:1.20",
+                "memory": 512,
+                "environment": [{"name": "ENV", "value": "staging"}],
+            },
+        ],
+    )
+
+    ecs_client.register_task_definition(
+        family="my-app",
+        containerDefinitions=[
+            {
+                "name": "web",
+                "image": "nginx:1.21",
+                "memory": 1024,
+                "environment": [{"name": "ENV", "value": "production"}],
+            },
+        ],
+    )
+
+    return ecs_client
 
 
 def test_list_task_definition_revisions(ecs_client_with_task_definitions):
@@ -4,9 +4,7 @@ from datetime import datetime
 from typing import Any
 from unittest.mock import Mock
 
-import boto3
 import pytest
-from moto import mock_aws
 
 from lazy_ecs.features.task.task import TaskService
 
@@ -226,20 +224,12 @@ class TestTaskHistoryService:
     """Test task history service methods."""
 
     @pytest.fixture
-    def mock_ecs_client(self, mock_paginated_client):
+    def mock_ecs_client(self, mock_history_client):
         """Mock ECS client for testing."""
-        pages = [
-            {
-                "taskArns": [
-                    "arn:aws:ecs:us-east-1:123456789012:task/cluster/running-task",
-                    "arn:aws:ecs:us-east-1:123456789012:task/cluster/stopped-task",
-                ],
-            },
-        ]
-        client = mock_paginated_client(pages)
-
-        client.describe_tasks.return_value = {
-            "tasks": [
+        return mock_history_client(
+            running_pages=[{"taskArns": ["arn:aws:ecs:us-east-1:123456789012:task/cluster/running-task"]}],
+            stopped_pages=[{"taskArns": ["arn:aws:ecs:us-east-1:123456789012:task/cluster/stopped-task"]}],
+            tasks=[
                 {
                     "taskArn": "arn:aws:ecs:us-east-1:123456789012:task/cluster/stopped-task",
                     "lastStatus": "STOPPED",
@@ -249,8 +239,7 @@ class TestTaskHistoryService:
                     "containers": [{"name": "web-api", "exitCode": 137}],
                 },
             ],
-        }
-        return client
+        )
 
     def test_get_task_history_includes_stopped_tasks(self, mock_ecs_client):
         """Test getting task history includes stopped tasks."""
@@ -271,41 +260,16 @@ class TestTaskHistoryService:
         assert result == []
 
 
-def test_get_task_history_with_more_than_100_tasks():
-    with mock_aws():
-        client = boto3.client("ecs", region_name="us-east-1")
-        client.create_cluster(clusterName="production")
-
-        client.register_task_definition(
-            family="app-task",
-            containerDefinitions=[{"name": "app", "image": "nginx", "memory": 256}],
-        )
+@pytest.mark.slow
+def test_get_task_history_with_more_than_100_tasks(moto_ecs_client, moto_cluster, moto_service, run_moto_task):
+    for _ in range(150):
+        run_moto_task()
 
-        client.create_service(
-            cluster="production",
-            serviceName="app-service",
-            taskDefinition="app-task",
-            desiredCount=150,
-        )
-
-        for _ in range(150):
-            client.run_task(
-                cluster="production",
-                taskDefinition="app-task",
-                launchType="FARGATE",
-                networkConfiguration={
-                    "awsvpcConfiguration": {
-                        "subnets": ["subnet-12345"],
-                        "assignPublicIp": "ENABLED",
-                    }
-                },
-            )
-
-        service = TaskService(client)
-        task_history = service.get_task_history("production", "app-service")
+    service = TaskService(moto_ecs_client)
+    task_history = service.get_task_history(moto_cluster, moto_service)
 
-        assert len(task_history) == 150
-        for task in task_history:
-            assert "task_arn" in task
-            assert "last_status" in task
-            assert "task_definition_name" in task
+    assert len(task_history) == 150
+    for task in task_history:
+        assert "task_arn" in task
+        assert "last_status" in task
+        assert "task_definition_name" in task
@@ -6,9 +6,66 @@ from unittest.mock import Mock, patch
 import pytest
 
 from lazy_ecs.core.types import TaskHistoryDetails
-from lazy_ecs.features.task.task import DEFAULT_STOPPED_TASK_HISTORY_LIMIT
+from lazy_ecs.features.task.task import DEFAULT_STOPPED_TASK_HISTORY_LIMIT, TaskService
 from lazy_ecs.features.task.ui import TaskUI
 
+RUNNING_CREATED_AT = datetime(2024, 1, 15, 12, 0, 0)
+RUNNING_STARTED_AT = datetime(2024, 1, 15, 12, 1, 0)
+FAILED_CREATED_AT = datetime(2024, 1, 15, 11, 30, 0)
+FAILED_STARTED_AT = datetime(2024, 1, 15, 11, 31, 0)
+FAILED_STOPPED_AT = datetime(2024, 1, 15, 11, 35, 0)
+
+
+@pytest.fixture(scope="module")
+def failed_task() -> TaskHistoryDetails:
+    return {
+        "task_arn": "arn:aws:ecs:us-east-1:123456789012:task/cluster/failed-task",
+        "task_definition_name": "web-api",
+        "task_definition_revision": "5",
+        "last_status": "STOPPED",
+        "desired_status": "STOPPED",
+        "stop_code": "TaskFailedToStart",
+        "stopped_reason": "Essential container in task exited",
+        "created_at": FAILED_CREATED_AT,
+        "started_at": FAILED_STARTED_AT,
+        "stopped_at": FAILED_STOPPED_AT,
+        "containers": [
+            {
+                "name": "web-api",
+                "exit_code": 137,
+                "reason": "OutOfMemoryError: Container killed due to memory usage",
+                "health_status": "UNHEALTHY",
+                "last_status": "STOPPED",
+            },
+        ],
+    }
+
+
+@pytest.fixture(scope="module")
+def sample_task_history(failed_task) -> list[TaskHistoryDetails]:
+    running_task: TaskHistoryDetails = {
+        "task_arn": "arn:aws:ecs:us-east-1:123456789012:task/cluster/running-task",
+        "task_definition_name": "web-api",
+        "task_definition_revision": "6",
+        "last_status": "RUNNING",
+        "desired_status": "RUNNING",
+        "stop_code": None,
+        "stopped_reason": None,
+        "created_at": RUNNING_CREATED_AT,
+        "started_at": RUNNING_STARTED_AT,
+        "stopped_at": None,
+        "containers": [
+            {
+                "name": "web-api",
+                "exit_code": None,
+                "reason": None,
+                "health_status": "HEALTHY",
+                "last_status": "RUNNING",
+            },
+        ],
+    }
+    return [running_task, failed_task]
+
 
 class TestTaskHistoryUI:
     """Test task history UI functionality."""
@@ -16,65 +73,16 @@ class TestTaskHistoryUI:
     @pytest.fixture
     def mock_task_service(self):
         """Mock task service for testing."""
-        return Mock()
+        return Mock(spec=TaskService)
 
     @pytest.fixture
     def task_ui(self, mock_task_service):
         """Task UI instance for testing."""
         return TaskUI(mock_task_service)
 
-    @pytest.fixture
-    def sample_task_history(self):
-        """Sample task history data for testing."""
-        return [
-            {
-                "task_arn": "arn:aws:ecs:us-east-1:123456789012:task/cluster/running-task",
-                "task_definition_name": "web-api",
-                "task_definition_revision": "6",
-                "last_status": "RUNNING",
-                "desired_status": "RUNNING",
-                "stop_code": None,
-                "stopped_reason": None,
-                "created_at": datetime(2024, 1, 15, 12, 0, 0),
-                "started_at": datetime(2024, 1, 15, 12, 1, 0),
-                "stopped_at": None,
-                "containers": [
-                    {
-                        "name": "web-api",
-                        "exit_code": None,
-                        "reason": None,
-                        "health_status": "HEALTHY",
-                        "last_status": "RUNNING",
-                    },
-                ],
-            },
-            {
-                "task_arn": "arn:aws:ecs:us-east-1:123456789012:task/cluster/failed-task",
-                "task_definition_name": "web-api",
-                "task_definition_revision": "5",
-                "last_status": "STOPPED",
-                "desired_status": "STOPPED",
-                "stop_code": "TaskFailedToStart",
-                "stopped_reason": "Essential container in task exited",
-                "created_at": datetime(2024, 1, 15, 11, 30, 0),
-                "started_at": datetime(2024, 1, 15, 11, 31, 0),
-                "stopped_at": datetime(2024, 1, 15, 11, 35, 0),
-                "containers": [
-                    {
-                        "name": "web-api",
-                        "exit_code": 137,
-                        "reason": "OutOfMemoryError: Container killed due to memory usage",
-                        "health_status": "UNHEALTHY",
-                        "last_status": "STOPPED",
-                    },
-                ],
-            },
-        ]
-
-    @patch("lazy_ecs.features.task.ui.console.print")
-    def test_display_task_history(self, mock_print, task_ui, mock_task_service, sample_task_history):
+    def test_display_task_history(self, captured_console, task_ui, mock_task_service, sample_task_history):
         """Test displaying task history."""
-        mock_task_service.get_task_history.return_value = sample_task_history
+        mock_task_service.iter_task_history.return_value = iter(sample_task_history)
         mock_task_service.get_task_failure_analysis.side_effect = [
             "✅ Task is currently running",
             "🔴 Container 'web-api' killed due to out of memory (OOM)",
@@ -83,7 +91,7 @@ class TestTaskHistoryUI:
         task_ui.display_task_history("test-cluster", "web-service")
 
         # Verify service method was called
-        mock_task_service.get_task_history.assert_called_once_with(
+        mock_task_service.iter_task_history.assert_called_once_with(
             "test-cluster",
             "web-service",
             stopped_limit=DEFAULT_STOPPED_TASK_HISTORY_LIMIT,
@@ -93,55 +101,30 @@ class TestTaskHistoryUI:
         mock_task_service.get_task_failure_analysis.assert_called()
 
         # Verify title was printed
-        assert any("Task History" in str(call) for call in mock_print.call_args_list)
-        assert any(
-            f"⚠️ Stopped task history fetch is capped at {DEFAULT_STOPPED_TASK_HISTORY_LIMIT} tasks." in str(call)
-            for call in mock_print.call_args_list
-        )
+        printed = "\n".join(str(args) for args in captured_console)
+        assert "Task History" in printed
+        assert f"⚠️ Stopped task history fetch is capped at {DEFAULT_STOPPED_TASK_HISTORY_LIMIT} tasks." in printed
 
         # The status indicators are displayed in a table, so we check that the table was created
         # The exact string matching is tricky with Rich tables, so we check the method calls
-        assert len(mock_print.call_args_list) > 3  # Title, table, summary lines
+        assert len(captured_console) > 3  # Title, table, summary lines
 
     @patch("lazy_ecs.features.task.ui.print_warning")
     def test_display_task_history_empty(self, mock_print_warning, task_ui, mock_task_service):
         """Test displaying empty task history."""
-        mock_task_service.get_task_history.return_value = []
+        mock_task_service.iter_task_history.return_value = iter([])
 
         task_ui.display_task_history("test-cluster", "web-service")
 
-        mock_task_service.get_task_history.assert_called_once_with(
+        mock_task_service.iter_task_history.assert_called_once_with(
             "test-cluster",
             "web-service",
             stopped_limit=DEFAULT_STOPPED_TASK_HISTORY_LIMIT,
         )
         mock_print_warning.assert_called_once_with("No task history found for this service")
 
-    @patch("lazy_ecs.features.task.ui.console.print")
-    def test_display_failure_analysis(self, mock_print, task_ui, mock_task_service):
+    def test_display_failure_analysis(self, captured_console, task_ui, mock_task_service, failed_task):
         """Test displaying failure analysis for a specific task."""
-        failed_task: TaskHistoryDetails = {
-            "task_arn": "arn:aws:ecs:us-east-1:123456789012:task/cluster/failed-task",
-            "task_definition_name": "web-api",
-            "task_definition_revision": "5",
-            "last_status": "STOPPED",
-            "desired_status": "STOPPED",
-            "stop_code": "TaskFailedToStart",
-            "stopped_reason": "Essential container in task exited",
-            "created_at": datetime(2024, 1, 15, 11, 30, 0),
-            "started_at": datetime(2024, 1, 15, 11, 31, 0),
-            "stopped_at": datetime(2024, 1, 15, 11, 35, 0),
-            "containers": [
-                {
-                    "name": "web-api",
-                    "exit_code": 137,
-                    "reason": "OutOfMemoryError: Container killed due to memory usage",
-                    "health_status": "UNHEALTHY",
-                    "last_status": "STOPPED",
-                },
-            ],
-        }
-
         mock_task_service.get_task_failure_analysis.return_value = (
             "🔴 Container 'web-api' killed due to out of memory (OOM)"
         )
@@ -149,5 +132,6 @@ class TestTaskHistoryUI:
         task_ui.display_failure_analysis(failed_task)
 
         mock_task_service.get_task_failure_analysis.assert_called_once_with(failed_task)
-        assert any("Failure Analysis" in str(call) for call in mock_print.call_args_list)
-        assert any("memory" in str(call) for call in mock_print.call_args_list)
+        printed = "\n".join(str(args) for args in captured_console)
+        assert "Failure Analysis" in printed
+        assert "memory" in printed
@@ -2,12 +2,11 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from typing import Any
 from unittest.mock import Mock
 
-import boto3
 import pytest
-from moto import mock_aws
+from botocore.exceptions import ClientError
 
 from lazy_ecs.features.task.task import (
     DEFAULT_STOPPED_TASK_HISTORY_LIMIT,
@@ -18,41 +17,69 @@ from lazy_ecs.features.task.task import (
     _get_brief_stop_reason,
 )
 
-if TYPE_CHECKING:
-    from mypy_boto3_ecs.client import ECSClient
 
+class _StubEcsClient:
+    """Canned describe responses for tests that never inspect call arguments."""
+
+    def __init__(self, tasks: list[dict[str, Any]] | None = None) -> None:
+        self._tasks = tasks or []
+
+    def describe_tasks(self, **_kwargs: Any) -> dict[str, Any]:  # noqa: ANN401
+        return {"tasks": self._tasks}
+
+    def describe_task_definition(self, **_kwargs: Any) -> dict[str, Any]:  # noqa: ANN401
+        return {}
 
-def test_get_task_details_returns_none_when_no_tasks():
-    mock_ecs_client = Mock()
-    mock_ecs_client.describe_tasks.return_value = {"tasks": []}
-    task_service = TaskService(mock_ecs_client)
 
-    result = task_service.get_task_details("cluster", "task-arn", None)
+@pytest.mark.parametrize(
+    ("method", "args", "tasks"),
+    [
+        ("get_task_details", ("cluster", "task-arn", None), []),
+        ("get_task_and_definition", ("cluster", "task-arn"), []),
+        (
+            "get_task_and_definition",
+            ("cluster", "task-arn"),
+            [{"taskArn": "arn:task", "taskDefinitionArn": "arn:task-def:1"}],
+        ),
+    ],
+    ids=["details_no_tasks", "definition_no_tasks", "definition_no_task_definition"],
+)
+def test_describe_lookups_return_none_when_missing(method, args, tasks):
+    task_service = TaskService(_StubEcsClient(tasks=tasks))  # type: ignore[arg-type]
+
+    result = getattr(task_service, method)(*args)
 
     assert result is None
 
 
-def test_get_task_and_definition_returns_none_when_no_tasks():
+def test_get_task_and_definition_reuses_cached_task_definition():
     mock_ecs_client = Mock()
-    mock_ecs_client.describe_tasks.return_value = {"tasks": []}
+    mock_ecs_client.describe_tasks.return_value = {
+        "tasks": [{"taskArn": "arn:task", "taskDefinitionArn": "arn:task-def:1"}],
+    }
+    mock_ecs_client.describe_task_definition.return_value = {"taskDefinition": {"family": "web"}}
     task_service = TaskService(mock_ecs_client)
 
-    result = task_service.get_task_and_definition("cluster", "task-arn")
+    first = task_service.get_task_and_definition("cluster", "arn:task")
+    second = task_service.get_task_and_definition("cluster", "arn:task")
 
-    assert result is None
+    assert first == second
+    assert mock_ecs_client.describe_tasks.call_count == 2
+    assert mock_ecs_client.describe_task_definition.call_count == 1
 
 
-def test_get_task_and_definition_returns_none_when_no_task_definition():
+def test_get_task_and_definition_does_not_cache_missing_task_definition():
     mock_ecs_client = Mock()
     mock_ecs_client.describe_tasks.return_value = {
-        "tasks": [{"taskArn": "arn:task", "taskDefinitionArn": "arn:task-def:1"}]
+        "tasks": [{"taskArn": "arn:task", "taskDefinitionArn": "arn:task-def:1"}],
     }
     mock_ecs_client.describe_task_definition.return_value = {}
     task_service = TaskService(mock_ecs_client)
 
-    result = task_service.get_task_and_definition("cluster", "task-arn")
+    task_service.get_task_and_definition("cluster", "arn:task")
+    task_service.get_task_and_definition("cluster", "arn:task")
 
-    assert result is None
+    assert mock_ecs_client.describe_task_definition.call_count == 2
 
 
 def test_stop_task_success():
@@ -64,11 +91,12 @@ def test_stop_task_success():
 
     assert success is True
     assert error is None
-    mock_ecs_client.stop_task.assert_called_once_with(
-        cluster="test-cluster",
-        task="arn:task:123",
-        reason="Stopped via lazy-ecs",
-    )
+    assert mock_ecs_client.stop_task.call_count == 1
+    assert mock_ecs_client.stop_task.call_args.kwargs == {
+        "cluster": "test-cluster",
+        "task": "arn:task:123",
+        "reason": "Stopped via lazy-ecs",
+    }
 
 
 def test_stop_task_with_custom_reason():
@@ -80,16 +108,15 @@ def test_stop_task_with_custom_reason():
 
     assert success is True
     assert error is None
-    mock_ecs_client.stop_task.assert_called_once_with(
-        cluster="test-cluster",
-        task="arn:task:123",
-        reason="Manual restart",
-    )
+    assert mock_ecs_client.stop_task.call_count == 1
+    assert mock_ecs_client.stop_task.call_args.kwargs == {
+        "cluster": "test-cluster",
+        "task": "arn:task:123",
+        "reason": "Manual restart",
+    }
 
 
 def test_stop_task_client_error():
-    from botocore.exceptions import ClientError
-
     mock_ecs_client = Mock()
     mock_ecs_client.stop_task.side_effect = ClientError(
         {"Error": {"Code": "AccessDenied", "Message": "Access denied"}},
@@ -101,11 +128,12 @@ def test_stop_task_client_error():
 
     assert success is False
     assert error == "Access denied"
-    mock_ecs_client.stop_task.assert_called_once_with(
-        cluster="test-cluster",
-        task="arn:task:123",
-        reason="Stopped via lazy-ecs",
-    )
+    assert mock_ecs_client.stop_task.call_count == 1
+    assert mock_ecs_client.stop_task.call_args.kwargs == {
+        "cluster": "test-cluster",
+        "task": "arn:task:123",
+        "reason": "Stopped via lazy-ecs",
+    }
 
 
 # Brief failure reason tests
@@ -204,78 +232,38 @@ def test_create_task_info_no_failure_for_running():
     assert "OOM" not in info["name"]
 
 
-def _run_moto_fargate_task(ecs_client: ECSClient, cluster_name: str, task_definition: str) -> str:
-    response = ecs_client.run_task(
-        cluster=cluster_name,
-        taskDefinition=task_definition,
-        count=1,
-        launchType="FARGATE",
-        networkConfiguration={
-            "awsvpcConfiguration": {
-                "subnets": ["subnet-12345"],
-                "assignPublicIp": "ENABLED",
-            },
-        },
-    )
-    return response["tasks"][0]["taskArn"]
-
-
-def _create_moto_task_history_client() -> ECSClient:
-    ecs_client = boto3.client("ecs", region_name="us-east-1")
-    ecs_client.create_cluster(clusterName="production")
-    ecs_client.register_task_definition(
-        family="web-task",
-        containerDefinitions=[{"name": "web", "image": "nginx", "memory": 256}],
-    )
-    ecs_client.create_service(
-        cluster="production",
-        serviceName="web",
-        taskDefinition="web-task",
-        desiredCount=0,
-    )
-    return ecs_client
-
-
-@mock_aws
-def test_get_task_history_caps_stopped_tasks_by_default_limit():
-    ecs_client = _create_moto_task_history_client()
-
+@pytest.mark.slow
+def test_get_task_history_caps_stopped_tasks_by_default_limit(moto_ecs_client, moto_cluster, run_moto_task):
     for _ in range(2):
-        _run_moto_fargate_task(ecs_client, "production", "web-task")
+        run_moto_task()
 
     for _ in range(DEFAULT_STOPPED_TASK_HISTORY_LIMIT + 15):
-        task_arn = _run_moto_fargate_task(ecs_client, "production", "web-task")
-        ecs_client.stop_task(cluster="production", task=task_arn, reason="history fixture")
+        run_moto_task(stopped=True)
 
-    task_service = TaskService(ecs_client)
-    history = task_service.get_task_history("production")
+    task_service = TaskService(moto_ecs_client)
+    history = task_service.get_task_history(moto_cluster)
 
     assert len(history) == 2 + DEFAULT_STOPPED_TASK_HISTORY_LIMIT
     assert sum(1 for task in history if task["last_status"] == "STOPPED") == DEFAULT_STOPPED_TASK_HISTORY_LIMIT
 
 
-@mock_aws
-def test_get_task_history_allows_uncapped_stopped_task_fetch():
-    ecs_client = _create_moto_task_history_client()
-    _run_moto_fargate_task(ecs_client, "production", "web-task")
+def test_get_task_history_allows_uncapped_stopped_task_fetch(moto_ecs_client, moto_cluster, run_moto_task):
+    run_moto_task()
     for _ in range(3):
-        task_arn = _run_moto_fargate_task(ecs_client, "production", "web-task")
-        ecs_client.stop_task(cluster="production", task=task_arn, reason="history fixture")
+        run_moto_task(stopped=True)
 
-    task_service = TaskService(ecs_client)
+    task_service = TaskService(moto_ecs_client)
 
-    history = task_service.get_task_history("production", stopped_limit=None)
+    history = task_service.get_task_history(moto_cluster, stopped_limit=None)
 
     assert len(history) == 4
     assert sum(1 for task in history if task["last_status"] == "STOPPED") == 3
 
 
-@mock_aws
-def test_get_task_history_handles_invalid_taskarn_pages(mocker):
-    ecs_client = _create_moto_task_history_client()
-    _run_moto_fargate_task(ecs_client, "production", "web-task")
+def test_get_task_history_handles_invalid_taskarn_pages(mocker, moto_ecs_client, moto_cluster, run_moto_task):
+    run_moto_task()
 
-    paginator = ecs_client.get_paginator("list_tasks")
+    paginator = moto_ecs_client.get_paginator("list_tasks")
     original_paginate = paginator.paginate
 
     def paginate_side_effect(**kwargs: Any) -> Any:  # noqa: ANN401
@@ -285,31 +273,150 @@ def test_get_task_history_handles_invalid_taskarn_pages(mocker):
         return page_iterator
 
     mocker.patch.object(paginator, "paginate", side_effect=paginate_side_effect)
-    mocker.patch.object(ecs_client, "get_paginator", return_value=paginator)
+    mocker.patch.object(moto_ecs_client, "get_paginator", return_value=paginator)
 
-    task_service = TaskService(ecs_client)
-    history = task_service.get_task_history("production")
+    task_service = TaskService(moto_ecs_client)
+    history = task_service.get_task_history(moto_cluster)
 
     assert len(history) >= 1
     assert all(task.get("task_arn") for task in history)
 
 
-@mock_aws
-def test_get_task_history_with_zero_stopped_limit():
-    ecs_client = _create_moto_task_history_client()
-    _run_moto_fargate_task(ecs_client, "production", "web-task")
-    task_arn = _run_moto_fargate_task(ecs_client, "production", "web-task")
-    ecs_client.stop_task(cluster="production", task=task_arn, reason="history fixture")
+def test_get_task_history_describes_only_valid_taskarn_pages(mock_history_client):
+    task_arn = "arn:aws:ecs:us-east-1:123456789012:task/production/abc123"
+    ecs_client = mock_history_client(
+        running_pages=[{"taskArns": "invalid"}, {"taskArns": [task_arn]}],
+        stopped_pages=[{"taskArns": []}],
+        tasks=[
+            {
+                "taskArn": task_arn,
+                "lastStatus": "RUNNING",
+                "taskDefinitionArn": "arn:aws:ecs:us-east-1:123456789012:task-definition/web-task:1",
+            },
+        ],
+    )
 
     task_service = TaskService(ecs_client)
-    history = task_service.get_task_history("production", stopped_limit=0)
+    history = task_service.get_task_history("production")
+
+    assert [task["task_arn"] for task in history] == [task_arn]
+    ecs_client.describe_tasks.assert_called_once_with(cluster="production", tasks=[task_arn])
+
+
+def test_get_task_history_describes_tasks_in_ordered_batches(mock_history_client):
+    task_arns = [f"arn:aws:ecs:us-east-1:123456789012:task/production/task-{i:03d}" for i in range(250)]
+    ecs_client = mock_history_client(running_pages=[{"taskArns": task_arns}], stopped_pages=[{"taskArns": []}])
+    ecs_client.describe_tasks.side_effect = lambda **kwargs: {
+        "tasks": [
+            {"taskArn": arn, "lastStatus": "RUNNING", "taskDefinitionArn": "arn:task-def/web-task:1"}
+            for arn in kwargs["tasks"]
+        ],
+    }
+
+    history = TaskService(ecs_client).get_task_history("production", stopped_limit=0)
+
+    assert [task["task_arn"] for task in history] == task_arns
+    assert sorted(len(call.kwargs["tasks"]) for call in ecs_client.describe_tasks.call_args_list) == [50, 100, 100]
+
+
+def test_describe_tasks_with_no_arns_skips_the_api():
+    ecs_client = Mock()
+
+    assert TaskService(ecs_client)._describe_tasks("production", []) == []
+    ecs_client.describe_tasks.assert_not_called()
+
+
+def test_get_task_history_with_zero_stopped_limit(moto_ecs_client, moto_cluster, run_moto_task):
+    run_moto_task()
+    run_moto_task(stopped=True)
+
+    task_service = TaskService(moto_ecs_client)
+    history = task_service.get_task_history(moto_cluster, stopped_limit=0)
 
     assert len(history) == 1
     assert all(task["last_status"] != "STOPPED" for task in history)
 
 
+def test_get_task_history_with_zero_stopped_limit_lists_running_tasks_inline(mocker, mock_history_client):
+    executor = mocker.patch("lazy_ecs.features.task.task.ThreadPoolExecutor")
+    ecs_client = mock_history_client(running_pages=[{"taskArns": []}], stopped_pages=[{"taskArns": []}])
+
+    TaskService(ecs_client).get_task_history("production", stopped_limit=0)
+
+    executor.assert_not_called()
+    ecs_client.get_paginator.return_value.paginate.assert_called_once_with(
+        cluster="production",
+        desiredStatus="RUNNING",
+    )
+
+
+@pytest.mark.parametrize(
+    ("stopped_limit", "expected_config"),
+    [
+        (25, {"MaxItems": 25, "PageSize": 25}),
+        (DEFAULT_STOPPED_TASK_HISTORY_LIMIT, {"MaxItems": 50, "PageSize": 50}),
+        (250, {"MaxItems": 250, "PageSize": 100}),
+    ],
+)
+def test_get_task_history_sizes_stopped_pages_to_limit(mock_history_client, stopped_limit, expected_config):
+    ecs_client = mock_history_client(running_pages=[{"taskArns": []}], stopped_pages=[{"taskArns": []}])
+
+    TaskService(ecs_client).get_task_history("production", stopped_limit=stopped_limit)
+
+    paginate_calls = ecs_client.get_paginator.return_value.paginate.call_args_list
+    stopped_calls = [call for call in paginate_calls if call.kwargs["desiredStatus"] == "STOPPED"]
+    assert len(stopped_calls) == 1
+    assert stopped_calls[0].kwargs["PaginationConfig"] == expected_config
+
+
+def test_get_task_history_skips_stopped_listing_for_zero_limit(mock_history_client):
+    ecs_client = mock_history_client(running_pages=[{"taskArns": []}], stopped_pages=[{"taskArns": []}])
+
+    TaskService(ecs_client).get_task_history("production", stopped_limit=0)
+
+    paginate_calls = ecs_client.get_paginator.return_value.paginate.call_args_list
+    assert [call.kwargs["desiredStatus"] for call in paginate_calls] == ["RUNNING"]
+
+
+def test_get_task_history_reuses_list_tasks_paginator(mock_history_client):
+    ecs_client = mock_history_client(running_pages=[{"taskArns": []}], stopped_pages=[{"taskArns": []}])
+    task_service = TaskService(ecs_client)
+
+    task_service.get_task_history("production")
+    task_service.get_task_history("production")
+
+    assert ecs_client.get_paginator.call_count == 1
+    assert ecs_client.get_paginator.return_value.paginate.call_count == 4
+
+
+def test_get_task_history_only_redescribes_running_tasks(mock_history_client):
+    statuses = {"arn:task/running": "RUNNING", "arn:task/stopped": "STOPPED"}
+    ecs_client = mock_history_client(
+        running_pages=[{"taskArns": ["arn:task/running"]}],
+        stopped_pages=[{"taskArns": ["arn:task/stopped"]}],
+    )
+    ecs_client.describe_tasks.side_effect = lambda **kwargs: {
+        "tasks": [
+            {"taskArn": arn, "lastStatus": statuses[arn], "taskDefinitionArn": "arn:task-def/web-task:1"}
+            for arn in kwargs["tasks"]
+        ],
+    }
+    task_service = TaskService(ecs_client)
+
+    first = task_service.get_task_history("production")
+    second = task_service.get_task_history("production")
+
+    assert first == second
+    assert [call.kwargs["tasks"] for call in ecs_client.describe_tasks.call_args_list] == [
+        ["arn:task/running", "arn:task/stopped"],
+        ["arn:task/running"],
+    ]
+
+
 def test_get_task_history_raises_for_negative_stopped_limit(mocker):
     task_service = TaskService(mocker.Mock())
 
     with pytest.raises(ValueError, match="stopped_limit must be >= 0 or None"):
         task_service.get_task_history("production", stopped_limit=-1)
+    with pytest.raises(ValueError, match="stopped_limit must be >= 0 or None"):
+        task_service.iter_task_history("production", stopped_limit=-1)
@@ -1,24 +1,34 @@
 """Tests for TaskUI class."""
 
-from unittest.mock import Mock, patch
+from datetime import datetime
+from unittest.mock import DEFAULT, Mock, patch
 
 import pytest
 
 from lazy_ecs.features.task.task import DEFAULT_STOPPED_TASK_HISTORY_LIMIT, TaskService
-from lazy_ecs.features.task.ui import TaskUI
+from lazy_ecs.features.task.ui import TaskUI, _select_recent_tasks
+
+MANY_TASK_CHOICES = tuple({"name": f"task-{i}", "value": f"task-arn-{i}"} for i in range(100))
+MANY_CONTAINERS = tuple({"name": f"container-{i}"} for i in range(10))
+
+
+@pytest.fixture(scope="module")
+def shared_task_ui():
+    return TaskUI(Mock(spec=TaskService))
 
 
 @pytest.fixture
-def task_ui(mock_ecs_client):
-    task_service = TaskService(mock_ecs_client)
-    return TaskUI(task_service)
+def task_ui(shared_task_ui):
+    # One TaskUI per module; only the service mock's calls and canned results are cleared per test
+    shared_task_ui.task_service.reset_mock(return_value=True, side_effect=True)
+    return shared_task_ui
 
 
 @patch("lazy_ecs.features.task.ui.select_with_auto_pagination")
 def test_select_task_multiple_tasks(mock_select, task_ui):
     """Test task selection with multiple tasks available."""
     task_info = [{"name": "task-1", "value": "task-arn-1"}, {"name": "task-2", "value": "task-arn-2"}]
-    task_ui.task_service.get_task_info = Mock(return_value=task_info)
+    task_ui.task_service.get_task_info.return_value = task_info
     mock_select.return_value = "task-arn-1"
 
     selected = task_ui.select_task("test-cluster", "web-api", "desired-task-def-arn")
@@ -30,7 +40,7 @@ def test_select_task_multiple_tasks(mock_select, task_ui):
 def test_select_task_auto_select_single_task(task_ui):
     """Test task selection with single task (auto-select)."""
     task_info = [{"name": "task-1", "value": "task-arn-1"}]
-    task_ui.task_service.get_task_info = Mock(return_value=task_info)
+    task_ui.task_service.get_task_info.return_value = task_info
 
     selected = task_ui.select_task("test-cluster", "web-api", "desired-task-def-arn")
 
@@ -39,30 +49,17 @@ def test_select_task_auto_select_single_task(task_ui):
 
 def test_select_task_no_tasks(task_ui):
     """Test task selection with no tasks available."""
-    task_ui.task_service.get_task_info = Mock(return_value=[])
+    task_ui.task_service.get_task_info.return_value = []
 
     selected = task_ui.select_task("test-cluster", "web-api", "desired-task-def-arn")
 
     assert selected == ""
 
 
-def test_display_task_details_success(task_ui):
+def test_display_task_details_success(task_ui, sample_task_details):
     """Test displaying task details successfully."""
-    task_details = {
-        "task_arn": "arn:aws:ecs:us-east-1:123456789012:task/test-cluster/abc123",
-        "task_definition_name": "web-api",
-        "task_definition_revision": "5",
-        "is_desired_version": True,
-        "task_status": "RUNNING",
-        "containers": [
-            {"name": "web-api", "image": "nginx:latest", "cpu": 256, "memory": 512, "memoryReservation": None},
-        ],
-        "created_at": None,
-        "started_at": None,
-    }
-
     # This test mainly ensures no exceptions are thrown
-    task_ui.display_task_details(task_details)
+    task_ui.display_task_details(sample_task_details)
     # If we get here without exception, the test passes
 
 
@@ -82,15 +79,10 @@ def test_select_task_feature_includes_show_task_details(mock_select, task_ui):
 
     result = task_ui.select_task_feature(task_details)
 
-    # Verify the call was made and get the choices (second positional arg)
-    mock_select.assert_called_once()
-    call_args = mock_select.call_args
-    choices = call_args[0][1]  # Second positional argument
-
-    # Check that "Show task details" is the first option
+    expected_first = {"name": "Show task details", "value": "task_action:show_details"}
+    choices = mock_select.call_args.args[1]
     assert len(choices) >= 2  # At least show_details, show_history
-    assert choices[0]["name"] == "Show task details"
-    assert choices[0]["value"] == "task_action:show_details"
+    assert choices[0] == expected_first
     assert result == "task_action:show_details"
 
 
@@ -103,48 +95,44 @@ def test_select_task_feature_show_history_is_second(mock_select, task_ui):
 
     task_ui.select_task_feature(task_details)
 
-    # Get the choices (second positional arg)
-    call_args = mock_select.call_args
-    choices = call_args[0][1]  # Second positional argument
-
-    # Check that "Show task history" is the second option
-    assert choices[1]["name"] == "Show task history and failures"
-    assert choices[1]["value"] == "task_action:show_history"
+    expected_second = {"name": "Show task history and failures", "value": "task_action:show_history"}
+    assert mock_select.call_args.args[1][1] == expected_second
 
 
 @patch("lazy_ecs.features.task.ui.select_with_auto_pagination")
 def test_select_task_with_many_tasks(mock_select, task_ui):
-    task_info = [{"name": f"task-{i}", "value": f"task-arn-{i}"} for i in range(100)]
-    task_ui.task_service.get_task_info = Mock(return_value=task_info)
+    task_info = list(MANY_TASK_CHOICES)
+    task_ui.task_service.get_task_info.return_value = task_info
     mock_select.return_value = "task-arn-50"
 
     selected = task_ui.select_task("test-cluster", "web-api", "desired-task-def-arn")
 
     assert selected == "task-arn-50"
-    mock_select.assert_called_once()
 
-    call_args = mock_select.call_args
-    choices = call_args[0][1]
-    assert len(choices) == 100
+    choices = mock_select.call_args.args[1]
+    assert choices is task_info
 
 
 @patch("lazy_ecs.features.task.ui.select_with_auto_pagination")
 def test_select_task_feature_with_many_containers(mock_select, task_ui):
-    containers = [{"name": f"container-{i}"} for i in range(10)]
-    task_details = {"containers": containers}
+    task_details = {"containers": list(MANY_CONTAINERS)}
     mock_select.return_value = "container_action:tail_logs:container-5"
 
     result = task_ui.select_task_feature(task_details)
 
     assert result == "container_action:tail_logs:container-5"
-    mock_select.assert_called_once()
 
-    call_args = mock_select.call_args
-    choices = call_args[0][1]
-    task_action_count = sum(1 for c in choices if c["value"].startswith("task_action:"))
-    container_action_count = sum(1 for c in choices if c["value"].startswith("container_action:"))
-    assert len(choices) == task_action_count + container_action_count
-    assert container_action_count == len(containers) * 5  # 5 actions per container
+    expected_values = {
+        f"task_action:{action}"
+        for action in ("show_details", "show_history", "compare_definitions", "open_console", "stop_task")
+    } | {
+        f"container_action:{action}:{container['name']}"
+        for container in MANY_CONTAINERS
+        for action in ("tail_logs", "show_env", "show_secrets", "show_ports", "show_volumes")
+    }
+    choices = mock_select.call_args.args[1]
+    assert len(choices) == len(expected_values)
+    assert {c["value"] for c in choices} == expected_values
 
 
 @patch("lazy_ecs.features.task.ui.select_with_auto_pagination")
@@ -154,8 +142,7 @@ def test_select_task_feature_includes_stop_task(mock_select, task_ui):
 
     result = task_ui.select_task_feature(task_details)
 
-    call_args = mock_select.call_args
-    choices = call_args[0][1]
+    choices = mock_select.call_args.args[1]
 
     stop_task_choices = [c for c in choices if c["value"] == "task_action:stop_task"]
     assert len(stop_task_choices) == 1
@@ -163,56 +150,45 @@ def test_select_task_feature_includes_stop_task(mock_select, task_ui):
     assert result == "task_action:stop_task"
 
 
-@patch("lazy_ecs.features.task.ui.console.print")
-@patch("lazy_ecs.features.task.ui.show_spinner")
-@patch("lazy_ecs.features.task.ui.questionary.confirm")
-def test_handle_stop_task_confirmed(mock_confirm, mock_spinner, mock_print, task_ui):
-    mock_confirm.return_value.ask.return_value = True
-    mock_spinner.return_value.__enter__ = Mock()
-    mock_spinner.return_value.__exit__ = Mock()
-    task_ui.task_service.stop_task = Mock(return_value=(True, None))
+@pytest.fixture
+def stop_task_patches():
+    with patch.multiple(
+        "lazy_ecs.features.task.ui", console=DEFAULT, show_spinner=DEFAULT, questionary=DEFAULT
+    ) as mocks:
+        yield mocks
 
-    task_ui.handle_stop_task(
-        "test-cluster",
-        "arn:aws:ecs:us-east-1:123456789012:task/test-cluster/abc123def456",
-        "web-api",
-    )
 
-    mock_confirm.assert_called_once()
-    mock_spinner.assert_called_once()
-    task_ui.task_service.stop_task.assert_called_once_with(
-        "test-cluster",
-        "arn:aws:ecs:us-east-1:123456789012:task/test-cluster/abc123def456",
-    )
-    success_call = [c for c in mock_print.call_args_list if c.args and "stopped successfully" in c.args[0]]
-    assert len(success_call) == 1
+STOP_TASK_ARN = "arn:aws:ecs:us-east-1:123456789012:task/test-cluster/abc123def456"
 
 
-@patch("lazy_ecs.features.task.ui.console.print")
-@patch("lazy_ecs.features.task.ui.questionary.confirm")
-def test_handle_stop_task_cancelled(mock_confirm, _mock_print, task_ui):
-    mock_confirm.return_value.ask.return_value = False
-    task_ui.task_service.stop_task = Mock()
+@pytest.mark.parametrize(
+    ("stop_result", "expected_message"),
+    [
+        pytest.param((True, None), "stopped successfully", id="success"),
+        pytest.param((False, "Access denied"), "Failed to stop task: Access denied", id="failure"),
+    ],
+)
+def test_handle_stop_task_confirmed(stop_task_patches, task_ui, stop_result, expected_message):
+    stop_task_patches["questionary"].confirm.return_value.ask.return_value = True
+    task_ui.task_service.stop_task.return_value = stop_result
 
-    task_ui.handle_stop_task("test-cluster", "arn:task:123", "web-api")
+    task_ui.handle_stop_task("test-cluster", STOP_TASK_ARN, "web-api")
 
-    task_ui.task_service.stop_task.assert_not_called()
+    stop_task_patches["questionary"].confirm.assert_called_once()
+    stop_task_patches["show_spinner"].assert_called_once()
+    task_ui.task_service.stop_task.assert_called_once_with("test-cluster", STOP_TASK_ARN)
+    printed = stop_task_patches["console"].print.call_args_list
+    assert sum(1 for c in printed if c.args and expected_message in c.args[0]) == 1
 
 
-@patch("lazy_ecs.features.task.ui.console.print")
-@patch("lazy_ecs.features.task.ui.show_spinner")
-@patch("lazy_ecs.features.task.ui.questionary.confirm")
-def test_handle_stop_task_failure(mock_confirm, mock_spinner, mock_print, task_ui):
-    mock_confirm.return_value.ask.return_value = True
-    mock_spinner.return_value.__enter__ = Mock()
-    mock_spinner.return_value.__exit__ = Mock()
-    task_ui.task_service.stop_task = Mock(return_value=(False, "Access denied"))
+def test_handle_stop_task_cancelled(stop_task_patches, task_ui):
+    stop_task_patches["questionary"].confirm.return_value.ask.return_value = False
 
-    task_ui.handle_stop_task("test-cluster", "arn:task:abc123", "web-api")
+    task_ui.handle_stop_task("test-cluster", STOP_TASK_ARN, "web-api")
 
-    task_ui.task_service.stop_task.assert_called_once_with("test-cluster", "arn:task:abc123")
-    error_call = [c for c in mock_print.call_args_list if c.args and "Failed to stop task: Access denied" in c.args[0]]
-    assert len(error_call) == 1
+    stop_task_patches["questionary"].confirm.assert_called_once()
+    stop_task_patches["show_spinner"].assert_not_called()
+    task_ui.task_service.stop_task.assert_not_called()
 
 
 def _build_task_history_entry(task_arn: str, last_status: str) -> dict:
@@ -237,27 +213,24 @@ def test_display_task_history_shows_count_and_default_cap_notice(mocker, task_ui
     mock_spinner.return_value.__enter__.return_value = None
     mock_spinner.return_value.__exit__.return_value = None
 
-    task_ui.task_service.get_task_history = mocker.MagicMock(
-        return_value=[
+    task_ui.task_service.iter_task_history.return_value = iter(
+        [
             _build_task_history_entry("arn:task/run-1", "RUNNING"),
             _build_task_history_entry("arn:task/stop-1", "STOPPED"),
         ],
     )
-    task_ui.task_service.get_task_failure_analysis = mocker.MagicMock(return_value="ok")
+    task_ui.task_service.get_task_failure_analysis.return_value = "ok"
 
     task_ui.display_task_history("production", "web")
 
-    task_ui.task_service.get_task_history.assert_called_once_with(
+    task_ui.task_service.iter_task_history.assert_called_once_with(
         "production",
         "web",
         stopped_limit=DEFAULT_STOPPED_TASK_HISTORY_LIMIT,
     )
-    printed = [str(call.args[0]) for call in mock_print.call_args_list if call.args]
-    assert any("Showing 2 of 2 fetched tasks." in line for line in printed)
-    assert any(
-        f"⚠️ Stopped task history fetch is capped at {DEFAULT_STOPPED_TASK_HISTORY_LIMIT} tasks." in line
-        for line in printed
-    )
+    printed = "\n".join(str(call.args[0]) for call in mock_print.call_args_list if call.args)
+    assert "Showing 2 of 2 fetched tasks." in printed
+    assert f"⚠️ Stopped task history fetch is capped at {DEFAULT_STOPPED_TASK_HISTORY_LIMIT} tasks." in printed
 
 
 def test_display_task_history_hides_cap_notice_when_uncapped(mocker, task_ui):
@@ -266,14 +239,26 @@ def test_display_task_history_hides_cap_notice_when_uncapped(mocker, task_ui):
     mock_spinner.return_value.__enter__.return_value = None
     mock_spinner.return_value.__exit__.return_value = None
 
-    task_ui.task_service.get_task_history = mocker.MagicMock(
-        return_value=[_build_task_history_entry("arn:task/run-1", "RUNNING")],
-    )
-    task_ui.task_service.get_task_failure_analysis = mocker.MagicMock(return_value="ok")
+    task_ui.task_service.iter_task_history.return_value = iter([_build_task_history_entry("arn:task/run-1", "RUNNING")])
+    task_ui.task_service.get_task_failure_analysis.return_value = "ok"
 
     task_ui.display_task_history("production", "web", stopped_limit=None)
 
-    task_ui.task_service.get_task_history.assert_called_once_with("production", "web", stopped_limit=None)
-    printed = [str(call.args[0]) for call in mock_print.call_args_list if call.args]
-    assert any("Showing 1 of 1 fetched tasks." in line for line in printed)
-    assert not any("⚠️ Stopped task history fetch is capped at" in line for line in printed)
+    task_ui.task_service.iter_task_history.assert_called_once_with("production", "web", stopped_limit=None)
+    printed = "\n".join(str(call.args[0]) for call in mock_print.call_args_list if call.args)
+    assert "Showing 1 of 1 fetched tasks." in printed
+    assert "⚠️ Stopped task history fetch is capped at" not in printed
+
+
+def test_select_recent_tasks_keeps_newest_and_counts_all():
+    tasks = []
+    for hour in range(12):
+        task = _build_task_history_entry(f"arn:task/task-{hour}", "STOPPED")
+        task["created_at"] = datetime(2024, 1, 1, hour)
+        tasks.append(task)
+    undated = _build_task_history_entry("arn:task/undated", "STOPPED")
+
+    recent_tasks, fetched_count = _select_recent_tasks(iter([*tasks, undated]), 3)
+
+    assert fetched_count == 13
+    assert [task["task_arn"] for task in recent_tasks] == ["arn:task/task-11", "arn:task/task-10", "arn:task/task-9"]
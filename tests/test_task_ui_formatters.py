@@ -40,11 +40,8 @@ def test_format_ports(ports, expected):
             ],
             "data:/app/data, logs:/var/log:ro, cache:/app/cache",
         ),
+        ([{"sourceVolume": "data"}], "data:?"),
     ],
 )
 def test_format_volumes(volumes, expected):
     assert _format_volumes(volumes) == expected
-
-
-def test_format_volumes_missing_fields():
-    assert "data:?" in _format_volumes([{"sourceVolume": "data"}])
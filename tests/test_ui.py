@@ -4,12 +4,24 @@ from unittest.mock import Mock, patch
 
 import pytest
 
+from lazy_ecs.core.types import TaskDetails
 from lazy_ecs.ui import ECSNavigator
 
+TWO_CONTAINER_TASK_DETAILS: TaskDetails = {
+    "task_arn": "task-123",
+    "task_definition_name": "web-task",
+    "task_definition_revision": "1",
+    "is_desired_version": True,
+    "task_status": "RUNNING",
+    "containers": [{"name": "web"}, {"name": "sidecar"}],
+    "created_at": None,
+    "started_at": None,
+}
+
 
 @pytest.fixture
-def mock_ecs_service() -> Mock:
-    return Mock()
+def navigator(mock_ecs_service) -> ECSNavigator:
+    return ECSNavigator(mock_ecs_service)
 
 
 def test_navigator_initialization(mock_ecs_service) -> None:
@@ -21,8 +33,7 @@ def test_navigator_initialization(mock_ecs_service) -> None:
     assert navigator._container_ui is not None
 
 
-def test_select_cluster_delegates_to_cluster_ui(mock_ecs_service) -> None:
-    navigator = ECSNavigator(mock_ecs_service)
+def test_select_cluster_delegates_to_cluster_ui(navigator) -> None:
     navigator._cluster_ui.select_cluster = Mock(return_value="production")
 
     result = navigator.select_cluster()
@@ -31,8 +42,7 @@ def test_select_cluster_delegates_to_cluster_ui(mock_ecs_service) -> None:
     navigator._cluster_ui.select_cluster.assert_called_once()
 
 
-def test_select_cluster_action_delegates_to_cluster_ui(mock_ecs_service) -> None:
-    navigator = ECSNavigator(mock_ecs_service)
+def test_select_cluster_action_delegates_to_cluster_ui(navigator) -> None:
     navigator._cluster_ui.select_cluster_action = Mock(return_value="cluster_action:open_console:production")
 
     result = navigator.select_cluster_action("production")
@@ -41,8 +51,7 @@ def test_select_cluster_action_delegates_to_cluster_ui(mock_ecs_service) -> None
     navigator._cluster_ui.select_cluster_action.assert_called_once_with("production")
 
 
-def test_select_service_delegates_to_service_ui(mock_ecs_service) -> None:
-    navigator = ECSNavigator(mock_ecs_service)
+def test_select_service_delegates_to_service_ui(navigator) -> None:
     navigator._service_ui.select_service = Mock(return_value="service:web-api")
 
     result = navigator.select_service("production")
@@ -51,10 +60,8 @@ def test_select_service_delegates_to_service_ui(mock_ecs_service) -> None:
     navigator._service_ui.select_service.assert_called_once_with("production")
 
 
-def test_select_service_action_integration(mock_ecs_service) -> None:
+def test_select_service_action_integration(mock_ecs_service, navigator) -> None:
     mock_ecs_service.get_task_info.return_value = [{"name": "task-1", "value": "task-arn-1"}]
-
-    navigator = ECSNavigator(mock_ecs_service)
     navigator._service_ui.select_service_action = Mock(return_value="task:show_details:task-arn-1")
 
     result = navigator.select_service_action("production", "web-api")
@@ -67,116 +74,82 @@ def test_select_service_action_integration(mock_ecs_service) -> None:
     )
 
 
-@patch("lazy_ecs.ui.select_with_navigation")
-def test_select_task_integration(mock_select, mock_ecs_service) -> None:
+def test_select_task_integration(monkeypatch, mock_ecs_service, navigator) -> None:
     """Test that select_task integrates with ECSService properly."""
+    mock_select = Mock(return_value="task-arn-1")
+    monkeypatch.setattr("lazy_ecs.ui.select_with_navigation", mock_select)
     mock_ecs_service.get_task_info.return_value = [
         {"name": "task-1", "value": "task-arn-1"},
         {"name": "task-2", "value": "task-arn-2"},
     ]
-    mock_select.return_value = "task-arn-1"
-
-    navigator = ECSNavigator(mock_ecs_service)
     result = navigator.select_task("production", "web-api")
 
     assert result == "task-arn-1"
     mock_ecs_service.get_task_info.assert_called_once_with("production", "web-api")
 
 
-def test_select_task_no_tasks(mock_ecs_service) -> None:
+def test_select_task_no_tasks(mock_ecs_service, navigator) -> None:
     """Test select_task with no tasks available."""
     mock_ecs_service.get_task_info.return_value = []
-
-    navigator = ECSNavigator(mock_ecs_service)
     result = navigator.select_task("production", "web-api")
 
     assert result == ""
 
 
-def test_display_task_details_delegates_to_task_ui(mock_ecs_service) -> None:
+def test_display_task_details_delegates_to_task_ui(navigator, sample_task_details) -> None:
     """Test that display_task_details delegates to TaskUI."""
-    from lazy_ecs.core.types import TaskDetails
-
-    navigator = ECSNavigator(mock_ecs_service)
     navigator._task_ui.display_task_details = Mock()
 
-    task_details: TaskDetails = {
-        "task_arn": "task-123",
-        "task_definition_name": "web-task",
-        "task_definition_revision": "1",
-        "is_desired_version": True,
-        "task_status": "RUNNING",
-        "containers": [],
-        "created_at": None,
-        "started_at": None,
-    }
-    navigator.display_task_details(task_details)
+    navigator.display_task_details(sample_task_details)
 
-    navigator._task_ui.display_task_details.assert_called_once_with(task_details)
+    navigator._task_ui.display_task_details.assert_called_once_with(sample_task_details)
 
 
-@patch("lazy_ecs.features.task.ui.select_with_auto_pagination")
-def test_select_task_feature_with_containers(mock_select, mock_ecs_service) -> None:
+def test_select_task_feature_with_containers(monkeypatch, navigator) -> None:
     """Test task feature selection with containers."""
-    from lazy_ecs.core.types import TaskDetails
-
-    mock_select.return_value = "container_action:tail_logs:web"
+    mock_select = Mock(return_value="container_action:tail_logs:web")
+    monkeypatch.setattr("lazy_ecs.features.task.ui.select_with_auto_pagination", mock_select)
 
-    navigator = ECSNavigator(mock_ecs_service)
-    task_details: TaskDetails = {
-        "task_arn": "task-123",
-        "task_definition_name": "web-task",
-        "task_definition_revision": "1",
-        "is_desired_version": True,
-        "task_status": "RUNNING",
-        "containers": [{"name": "web"}, {"name": "sidecar"}],
-        "created_at": None,
-        "started_at": None,
-    }
-
-    selected = navigator.select_task_feature(task_details)
+    selected = navigator.select_task_feature(TWO_CONTAINER_TASK_DETAILS)
 
     assert selected == "container_action:tail_logs:web"
     mock_select.assert_called_once()
+    choice_values = {choice["value"] for choice in mock_select.call_args[0][1]}
+    assert {
+        f"container_action:{action}:{container}"
+        for container in ("web", "sidecar")
+        for action in ("tail_logs", "show_env", "show_secrets", "show_ports", "show_volumes")
+    } <= choice_values
 
 
-def test_select_task_feature_no_containers(mock_ecs_service) -> None:
+def test_select_task_feature_no_containers(navigator) -> None:
     """Test task feature selection with no containers."""
-    navigator = ECSNavigator(mock_ecs_service)
-
     selected = navigator.select_task_feature(None)
 
     assert selected is None
 
 
-def test_container_methods_delegate_to_container_ui(mock_ecs_service) -> None:
-    """Test that all container methods delegate to ContainerUI."""
-    navigator = ECSNavigator(mock_ecs_service)
+@pytest.mark.parametrize(
+    ("nav_method", "ui_method"),
+    [
+        ("show_container_logs_live_tail", "show_logs_live_tail"),
+        ("show_container_environment_variables", "show_container_environment_variables"),
+        ("show_container_secrets", "show_container_secrets"),
+        ("show_container_port_mappings", "show_container_port_mappings"),
+        ("show_container_volume_mounts", "show_container_volume_mounts"),
+    ],
+)
+def test_container_methods_delegate_to_container_ui(navigator, nav_method, ui_method) -> None:
+    """Test that each container method delegates to ContainerUI."""
+    ui_mock = Mock()
+    setattr(navigator._container_ui, ui_method, ui_mock)
 
-    # Mock all ContainerUI methods
-    navigator._container_ui.show_logs_live_tail = Mock()
-    navigator._container_ui.show_container_environment_variables = Mock()
-    navigator._container_ui.show_container_secrets = Mock()
-    navigator._container_ui.show_container_port_mappings = Mock()
-    navigator._container_ui.show_container_volume_mounts = Mock()
-
-    # Test delegation
-    navigator.show_container_logs_live_tail("cluster", "task", "container")
-    navigator.show_container_environment_variables("cluster", "task", "container")
-    navigator.show_container_secrets("cluster", "task", "container")
-    navigator.show_container_port_mappings("cluster", "task", "container")
-    navigator.show_container_volume_mounts("cluster", "task", "container")
-
-    # Verify delegation
-    navigator._container_ui.show_logs_live_tail.assert_called_once_with("cluster", "task", "container")
-    navigator._container_ui.show_container_environment_variables.assert_called_once_with("cluster", "task", "container")
-    navigator._container_ui.show_container_secrets.assert_called_once_with("cluster", "task", "container")
-    navigator._container_ui.show_container_port_mappings.assert_called_once_with("cluster", "task", "container")
-    navigator._container_ui.show_container_volume_mounts.assert_called_once_with("cluster", "task", "container")
-
-
-def test_handle_force_deployment_delegates_to_service_ui(mock_ecs_service) -> None:
-    navigator = ECSNavigator(mock_ecs_service)
+    getattr(navigator, nav_method)("cluster", "task", "container")
+
+    ui_mock.assert_called_once_with("cluster", "task", "container")
+
+
+def test_handle_force_deployment_delegates_to_service_ui(navigator) -> None:
     navigator._service_ui.handle_force_deployment = Mock()
 
     navigator.handle_force_deployment("cluster", "service")
@@ -184,8 +157,7 @@ def test_handle_force_deployment_delegates_to_service_ui(mock_ecs_service) -> No
     navigator._service_ui.handle_force_deployment.assert_called_once_with("cluster", "service")
 
 
-def test_show_service_events_delegates_to_service_ui(mock_ecs_service):
-    navigator = ECSNavigator(mock_ecs_service)
+def test_show_service_events_delegates_to_service_ui(navigator):
     navigator._service_ui.display_service_events = Mock()
 
     navigator.show_service_events("cluster", "service")
@@ -193,10 +165,9 @@ def test_show_service_events_delegates_to_service_ui(mock_ecs_service):
     navigator._service_ui.display_service_events.assert_called_once_with("cluster", "service")
 
 
-@patch("lazy_ecs.ui.console")
-def test_show_service_metrics_with_data(_mock_console, mock_ecs_service):
+def test_show_service_metrics_with_data(monkeypatch, mock_ecs_service, navigator):
+    monkeypatch.setattr("lazy_ecs.ui.console", Mock())
     mock_ecs_service.get_service_metrics.return_value = {"cpu": 50.0, "memory": 60.0}
-    navigator = ECSNavigator(mock_ecs_service)
     navigator._service_ui.display_service_metrics = Mock()
 
     navigator.show_service_metrics("cluster", "service")
@@ -204,18 +175,17 @@ def test_show_service_metrics_with_data(_mock_console, mock_ecs_service):
     navigator._service_ui.display_service_metrics.assert_called_once_with("service", {"cpu": 50.0, "memory": 60.0})
 
 
-@patch("lazy_ecs.ui.console")
-def test_show_service_metrics_no_data(mock_console, mock_ecs_service):
+def test_show_service_metrics_no_data(monkeypatch, mock_ecs_service, navigator):
+    mock_console = Mock()
+    monkeypatch.setattr("lazy_ecs.ui.console", mock_console)
     mock_ecs_service.get_service_metrics.return_value = None
-    navigator = ECSNavigator(mock_ecs_service)
 
     navigator.show_service_metrics("cluster", "service")
 
     mock_console.print.assert_any_call("\n⚠️ No metrics available for service 'service'", style="yellow")
 
 
-def test_show_task_history_delegates_to_task_ui(mock_ecs_service):
-    navigator = ECSNavigator(mock_ecs_service)
+def test_show_task_history_delegates_to_task_ui(navigator):
     navigator._task_ui.display_task_history = Mock()
 
     navigator.show_task_history("cluster", "service")
@@ -223,8 +193,7 @@ def test_show_task_history_delegates_to_task_ui(mock_ecs_service):
     navigator._task_ui.display_task_history.assert_called_once_with("cluster", "service")
 
 
-def test_show_task_definition_comparison_with_details(mock_ecs_service):
-    navigator = ECSNavigator(mock_ecs_service)
+def test_show_task_definition_comparison_with_details(navigator):
     navigator._task_ui.show_task_definition_comparison = Mock()
     task_details = {"taskArn": "arn:task"}
 
@@ -233,8 +202,7 @@ def test_show_task_definition_comparison_with_details(mock_ecs_service):
     navigator._task_ui.show_task_definition_comparison.assert_called_once_with(task_details)
 
 
-def test_show_task_definition_comparison_without_details(mock_ecs_service):
-    navigator = ECSNavigator(mock_ecs_service)
+def test_show_task_definition_comparison_without_details(navigator):
     navigator._task_ui.show_task_definition_comparison = Mock()
 
     navigator.show_task_definition_comparison(None)
@@ -242,10 +210,9 @@ def test_show_task_definition_comparison_without_details(mock_ecs_service):
     navigator._task_ui.show_task_definition_comparison.assert_not_called()
 
 
-def test_open_service_in_console(mock_ecs_service):
+def test_open_service_in_console(mock_ecs_service, navigator):
     with patch("webbrowser.open") as mock_webbrowser:
         mock_ecs_service.get_region.return_value = "us-east-1"
-        navigator = ECSNavigator(mock_ecs_service)
 
         navigator.open_service_in_console("production", "web-api")
 
@@ -256,10 +223,9 @@ def test_open_service_in_console(mock_ecs_service):
         assert "web-api" in url_arg
 
 
-def test_open_cluster_in_console(mock_ecs_service):
+def test_open_cluster_in_console(mock_ecs_service, navigator):
     with patch("webbrowser.open") as mock_webbrowser:
         mock_ecs_service.get_region.return_value = "us-east-1"
-        navigator = ECSNavigator(mock_ecs_service)
 
         navigator.open_cluster_in_console("production")
 
@@ -269,10 +235,9 @@ def test_open_cluster_in_console(mock_ecs_service):
         assert "production" in url_arg
 
 
-def test_open_task_in_console(mock_ecs_service):
+def test_open_task_in_console(mock_ecs_service, navigator):
     with patch("webbrowser.open") as mock_webbrowser:
         mock_ecs_service.get_region.return_value = "us-west-2"
-        navigator = ECSNavigator(mock_ecs_service)
 
         navigator.open_task_in_console("staging", "task-arn-123")
 